@@ -29,6 +29,8 @@ class AppYamlConfig:
     _computed_cache: Dict[str, Any] = {}
     _load_result: Optional[LoadResult] = None
     _computing_stack: List[str] = []
+    # Bumped whenever _data is replaced, so dependents can drop derived caches
+    _generation: int = 0
 
     def __new__(cls) -> 'AppYamlConfig':
         if cls._instance is None:
@@ -133,6 +135,7 @@ class AppYamlConfig:
         instance._computed_definitions = computed_definitions or {}
         instance._computed_cache = {}
         instance._load_result = result
+        instance._generation += 1
         instance._initialized = True
         
         logger.info(f"AppYamlConfig initialized. Loaded: {len(result.files_loaded)} files.")
@@ -203,6 +206,10 @@ class AppYamlConfig:
     def get_load_result(self) -> Optional[LoadResult]:
         return self._load_result
 
+    def get_generation(self) -> int:
+        """Counter bumped each time the config data is (re)loaded."""
+        return self._generation
+
     def register_computed(self, key: str, definition: ComputedDefinition) -> None:
         """Register a computed definition after initialization.
         
@@ -232,3 +239,4 @@ class AppYamlConfig:
         self._computed_cache = {}
         self._load_result = None
         self._computing_stack = []
+        self._generation += 1
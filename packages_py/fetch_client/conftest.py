@@ -0,0 +1,18 @@
+"""
+Shared pytest configuration for fetch_client tests (both tests/ and tests_fetch_client/).
+"""
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is unavailable on Windows/PyPy
+    uvloop = None
+
+
+if uvloop is not None:
+
+    # optionalhook: pytest-asyncio releases without this hook run on the default loop
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
@@ -1,6 +1,7 @@
 
 import pytest
 from unittest.mock import AsyncMock, Mock, patch, ANY
+from dataclasses import dataclass
 from types import SimpleNamespace
 from typing import Any, Dict
 
@@ -10,28 +11,60 @@ from fetch_client.client import FetchClient
 from fetch_client.config import AuthConfig
 from httpx import ConnectError, TimeoutException, Response
 
+# Stub for FetchResponse since we don't want to rely on real one
+class FetchResponseStub:
+    __slots__ = ("status", "data", "headers", "status_text")
+
+    def __init__(self, status, data, headers=None):
+        self.status = status
+        self.data = data
+        self.headers = headers or {"content-type": "application/json"}
+        self.status_text = "OK" if status == 200 else "Error"
+
+# Canonical responses shared by tests (never mutated)
+_OK_EMPTY = FetchResponseStub(200, {})
+_OK_STR = FetchResponseStub(200, "ok")
+_OK_STATUS = FetchResponseStub(200, {"status": "ok"})
+
 # Setup dummy config structure
+_NO_PROXY = SimpleNamespace(proxy_url=None)
+
+@dataclass(slots=True, frozen=True)
+class _RuntimeConfig:
+    config: Dict[str, Any]
+    headers: Dict[str, str]
+    auth_config: Any
+    proxy_config: Any
+
 def create_runtime_config(
     config: Dict[str, Any], 
     headers: Dict[str, str] = None, 
     auth_config: Any = None
-) -> SimpleNamespace:
-    return SimpleNamespace(
+) -> _RuntimeConfig:
+    return _RuntimeConfig(
         config=config,
         headers=headers or {},
         auth_config=auth_config,
-        proxy_config=SimpleNamespace(proxy_url=None)
+        proxy_config=_NO_PROXY
     )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_fetch_client():
+    # Patch once per module; _reset_mocks clears recorded state between tests.
     with patch("fetch_client.provider.provider_client.FetchClient") as mock:
         client_instance = AsyncMock()
         mock.create.return_value = client_instance
         yield mock, client_instance
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_fetch_client):
+    mock, client_instance = mock_fetch_client
+    mock.reset_mock()
+    client_instance.reset_mock(return_value=True, side_effect=True)
+
+@pytest.fixture(scope="module")
 def valid_config():
+    # Not mutated by any test, so build it once per module.
     return create_runtime_config(
         config={
             "base_url": "https://api.example.com",
@@ -52,7 +85,7 @@ async def test_client_creation(mock_fetch_client, valid_config):
     mock_cls, mock_instance = mock_fetch_client
     
     provider = ProviderClient("test", valid_config)
-    mock_instance.request.return_value = FetchResponseStub(200, {})
+    mock_instance.request.return_value = _OK_EMPTY
     
     await provider.get("/foo")
     
@@ -68,7 +101,7 @@ async def test_client_creation(mock_fetch_client, valid_config):
 @pytest.mark.asyncio
 async def test_request_delegation(mock_fetch_client, valid_config):
     _, mock_instance = mock_fetch_client
-    mock_instance.request.return_value = FetchResponseStub(200, "ok")
+    mock_instance.request.return_value = _OK_STR
     
     provider = ProviderClient("test", valid_config)
     await provider.get("/foo?q=1")
@@ -78,7 +111,7 @@ async def test_request_delegation(mock_fetch_client, valid_config):
 @pytest.mark.asyncio
 async def test_check_health_success(mock_fetch_client, valid_config):
     _, mock_instance = mock_fetch_client
-    mock_instance.request.return_value = FetchResponseStub(200, {"status": "ok"})
+    mock_instance.request.return_value = _OK_STATUS
     
     provider = ProviderClient("test", valid_config)
     result = await provider.check_health()
@@ -90,7 +123,7 @@ async def test_check_health_success(mock_fetch_client, valid_config):
 @pytest.mark.asyncio
 async def test_check_health_placeholders(mock_fetch_client):
     mock_cls, mock_instance = mock_fetch_client
-    mock_instance.request.return_value = FetchResponseStub(200, {})
+    mock_instance.request.return_value = _OK_EMPTY
     
     config = create_runtime_config(
         config={
@@ -150,11 +183,3 @@ def test_diagnostics(valid_config):
     opts = provider.get_fetch_option_used()
     assert opts.headers["Authorization"] == "****"
     assert opts.headers["X-Config"] == "val"
-
-# Stub for FetchResponse since we don't want to rely on real one
-class FetchResponseStub:
-    def __init__(self, status, data, headers=None):
-        self.status = status
-        self.data = data
-        self.headers = headers or {"content-type": "application/json"}
-        self.status_text = "OK" if status == 200 else "Error"
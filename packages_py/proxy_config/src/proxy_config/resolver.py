@@ -2,12 +2,16 @@
 Proxy URL resolution logic.
 """
 import os
+import sys
 import logging
 from typing import Optional, Union
 from .types import NetworkConfig
 
 logger = logging.getLogger(__name__)
 
+# Env var fallback order, checked after the network config sources.
+_ENV_KEYS = ("PROXY_URL", "HTTPS_PROXY", "HTTP_PROXY")
+
 def resolve_proxy_url(
     network_config: Optional[NetworkConfig] = None,
     proxy_url_override: Optional[Union[str, bool]] = None
@@ -23,55 +27,52 @@ def resolve_proxy_url(
     6. PROXY_URL env var
     7. HTTPS_PROXY env var
     8. HTTP_PROXY env var
+
+    Returned URLs are interned so repeat callers share one string object.
     """
-    logger.debug(f"Resolving proxy URL. Config: {bool(network_config)}, Override: {proxy_url_override}")
+    # 2. Explicit override (checked first: cheapest and most common, no logging)
+    if isinstance(proxy_url_override, str) and proxy_url_override:
+        return sys.intern(proxy_url_override)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Resolving proxy URL. Config: %s, Override: %s",
+            bool(network_config), proxy_url_override
+        )
 
     # 1. Explicit disable
     if proxy_url_override is False:
         logger.debug("Proxy explicitly disabled via override=False")
         return None
 
-    # 2. Explicit override
-    if isinstance(proxy_url_override, str) and proxy_url_override:
-        logger.debug("Using explicit proxy URL override")
-        return proxy_url_override
-
     # Check network config sources
     if network_config:
         # 3 & 4. Agent proxy config
-        if network_config.agent_proxy:
-            if network_config.agent_proxy.https_proxy:
+        agent_proxy = network_config.agent_proxy
+        if agent_proxy:
+            https_proxy = agent_proxy.https_proxy
+            if https_proxy:
                 logger.debug("Using agent_proxy.https_proxy")
-                return network_config.agent_proxy.https_proxy
-            if network_config.agent_proxy.http_proxy:
+                return sys.intern(https_proxy)
+            http_proxy = agent_proxy.http_proxy
+            if http_proxy:
                 logger.debug("Using agent_proxy.http_proxy")
-                return network_config.agent_proxy.http_proxy
+                return sys.intern(http_proxy)
 
         # 5. Environment-specific proxy URL
-        if network_config.default_environment:
-            env_proxy = network_config.proxy_urls.get(network_config.default_environment)
+        default_environment = network_config.default_environment
+        if default_environment:
+            env_proxy = network_config.proxy_urls.get(default_environment)
             if env_proxy:
-                logger.debug(f"Using proxy URL for environment '{network_config.default_environment}'")
-                return env_proxy
-
-    # Env var fallback
-    # 6. PROXY_URL
-    proxy_url_env = os.getenv("PROXY_URL")
-    if proxy_url_env:
-        logger.debug("Using PROXY_URL env var")
-        return proxy_url_env
-
-    # 7. HTTPS_PROXY
-    https_proxy_env = os.getenv("HTTPS_PROXY")
-    if https_proxy_env:
-        logger.debug("Using HTTPS_PROXY env var")
-        return https_proxy_env
+                logger.debug("Using proxy URL for environment %r", default_environment)
+                return sys.intern(env_proxy)
 
-    # 8. HTTP_PROXY
-    http_proxy_env = os.getenv("HTTP_PROXY")
-    if http_proxy_env:
-        logger.debug("Using HTTP_PROXY env var")
-        return http_proxy_env
+    # 6-8. Env var fallback (PROXY_URL, HTTPS_PROXY, HTTP_PROXY)
+    for key in _ENV_KEYS:
+        value = os.environ.get(key)
+        if value:
+            logger.debug("Using %s env var", key)
+            return sys.intern(value)
 
     logger.debug("No proxy URL found")
     return None
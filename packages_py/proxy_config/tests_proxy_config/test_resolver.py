@@ -33,3 +33,37 @@ class TestResolveProxyUrl:
         """Should fall back to env vars."""
         monkeypatch.setenv("PROXY_URL", "http://env-proxy")
         assert resolve_proxy_url() == "http://env-proxy"
+
+    def test_env_var_fallback_order(self, monkeypatch):
+        """PROXY_URL wins over HTTPS_PROXY, which wins over HTTP_PROXY."""
+        monkeypatch.delenv("PROXY_URL", raising=False)
+        monkeypatch.setenv("HTTPS_PROXY", "http://https-proxy")
+        monkeypatch.setenv("HTTP_PROXY", "http://http-proxy")
+        assert resolve_proxy_url() == "http://https-proxy"
+
+        monkeypatch.delenv("HTTPS_PROXY")
+        assert resolve_proxy_url() == "http://http-proxy"
+
+    def test_resolved_url_is_interned(self):
+        """Equal URLs resolved from different sources should be the same object."""
+        config = NetworkConfig(proxy_urls={"dev": "".join(["http://", "dev-proxy"])})
+        assert resolve_proxy_url(network_config=config) is resolve_proxy_url(
+            proxy_url_override="".join(["http://", "dev-proxy"])
+        )
+
+    def test_environment_proxy_follows_config_changes(self):
+        """Reassigned fields, in-place edits and model_copy updates are all seen."""
+        config = NetworkConfig(
+            default_environment="stage",
+            proxy_urls={"stage": "http://stage-proxy", "prod": "http://prod-proxy"}
+        )
+        assert resolve_proxy_url(network_config=config) == "http://stage-proxy"
+
+        config.default_environment = "prod"
+        assert resolve_proxy_url(network_config=config) == "http://prod-proxy"
+
+        config.proxy_urls["prod"] = "http://edited-prod-proxy"
+        assert resolve_proxy_url(network_config=config) == "http://edited-prod-proxy"
+
+        copy = config.model_copy(update={"proxy_urls": {"prod": "http://copied-proxy"}})
+        assert resolve_proxy_url(network_config=copy) == "http://copied-proxy"
@@ -122,6 +122,8 @@ def example3_convenience_function() -> None:
 async def example4_get_clients() -> None:
     """
     Convenience functions to get pre-configured httpx clients.
+    The async client is new and owned by the caller; the sync client is
+    shared per settings and closed at exit.
     """
     # Get async client
     async_client = get_async_client(timeout=30.0)
@@ -136,9 +138,10 @@ async def example4_get_clients() -> None:
     kwargs = get_request_kwargs(timeout=30.0)
     print(f"  request_kwargs: {list(kwargs.keys())}")
 
-    # Clean up
+    print(f"  sync shared: {get_sync_client(timeout=30.0) is sync_client}")
+
+    # Clean up the caller-owned async client
     await async_client.aclose()
-    sync_client.close()
 
 
 # =============================================================================
@@ -262,11 +265,15 @@ def example9_fastapi_integration() -> None:
     # Create singleton factory at app startup
     factory = ProxyDispatcherFactory(config=factory_config)
 
-    # In FastAPI dependencies:
-    # async def get_http_client():
-    #     result = factory.get_proxy_dispatcher(async_client=True)
-    #     async with result.client as client:
-    #         yield client
+    # In FastAPI, create one shared client in the lifespan handler:
+    # @asynccontextmanager
+    # async def lifespan(app):
+    #     app.state.http_client = factory.get_or_create_shared_async_client()
+    #     yield
+    #     await factory.aclose()
+    #
+    # def get_http_client(request: Request) -> httpx.AsyncClient:
+    #     return request.app.state.http_client
 
     print("\nExample 9 - FastAPI integration:")
     print(f"  Factory created with default_env: {factory_config.default_environment}")
@@ -2,7 +2,8 @@
 FastAPI example using proxy_dispatcher.
 """
 import logging
-from fastapi import FastAPI, Depends
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Depends, Request
 from proxy_dispatcher import get_async_client, ProxyDispatcherFactory, FactoryConfig
 from proxy_config import NetworkConfig
 import httpx
@@ -11,8 +12,6 @@ import httpx
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
-
 # 1. Dependency Injection approach (Recommended)
 # Create a global factory instance
 # In a real app, you might load this from app.yaml via app-yaml-config
@@ -25,12 +24,19 @@ factory_config = FactoryConfig(
 )
 factory = ProxyDispatcherFactory(config=factory_config)
 
-async def get_http_client():
-    """Dependency that provides a configured async client."""
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create one shared client at startup so its connection pool is reused."""
     # This will auto-detect environment (APP_ENV) or use default
-    result = factory.get_proxy_dispatcher(async_client=True)
-    async with result.client as client:
-        yield client
+    app.state.http_client = factory.get_or_create_shared_async_client()
+    yield
+    await factory.aclose()
+
+app = FastAPI(lifespan=lifespan)
+
+def get_http_client(request: Request) -> httpx.AsyncClient:
+    """Dependency that provides the shared async client (do not close it)."""
+    return request.app.state.http_client
 
 @app.get("/health")
 async def health():
@@ -42,7 +48,7 @@ async def proxy_test(client: httpx.AsyncClient = Depends(get_http_client)):
     try:
         # Example request (would normally hit an external service)
         # For demo purposes we just show what would happen
-        logger.info(f"Client headers: {client.headers}")
+        logger.info("Client headers: %s", client.headers)
         return {
             "message": "Client created with proxy settings",
             "proxy_configured": True # We can't easily inspect the internal proxy mount in httpx public API
@@ -54,10 +60,9 @@ async def proxy_test(client: httpx.AsyncClient = Depends(get_http_client)):
 @app.get("/simple-proxy-test")
 async def simple_proxy_test():
     """Uses the global default factory."""
-    # This uses os.environ for configuration
-    client = get_async_client()
-    async with client as c:
-        return {"message": "Created client from global factory"}
+    # This uses os.environ for configuration; the client belongs to this request
+    async with get_async_client() as client:
+        return {"message": "Created client from global factory", "trust_env": client.trust_env}
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,35 +1,55 @@
 """
 Adapter registry.
+
+Built-in adapters are registered at import. Third-party adapters can be
+registered explicitly with register_adapter(), or published under the
+``proxy_dispatcher.adapters`` entry point group, which is only scanned the
+first time an unknown adapter name is requested.
 """
 import logging
-from typing import Dict, Type
+from importlib.metadata import entry_points
+from typing import Dict, Optional, Type
 from .base import BaseAdapter
 from .adapter_httpx import HttpxAdapter
 
 logger = logging.getLogger(__name__)
 
-_adapters: Dict[str, Type[BaseAdapter]] = {}
+ENTRY_POINT_GROUP = "proxy_dispatcher.adapters"
+
+_adapters: Dict[str, BaseAdapter] = {}
 
 def register_adapter(adapter_cls: Type[BaseAdapter]) -> None:
-    """Register an adapter class."""
-    # Instantiating to get the name property effectively requires the class to be instantiated or property allows class access
-    # Easier to just instantiate temporarily or make name a class property.
-    # For now, let's just make an instance.
+    """Register an adapter class; a single instance is created and shared."""
+    if type(_adapters.get(adapter_cls.name)) is adapter_cls:
+        return  # Already registered; keep the existing instance
     try:
         instance = adapter_cls()
-        name = instance.name
-        _adapters[name] = adapter_cls
-        logger.debug(f"Registered adapter: {name}")
+        _adapters[adapter_cls.name] = instance
+        logger.debug("Registered adapter: %s", adapter_cls.name)
     except Exception as e:
-        logger.error(f"Failed to register adapter {adapter_cls}: {e}")
+        logger.error("Failed to register adapter %s: %s", adapter_cls, e)
+
+def _load_entry_point_adapter(name: str) -> Optional[BaseAdapter]:
+    """Load and register an adapter published via entry points, if any."""
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        if entry_point.name == name:
+            register_adapter(entry_point.load())
+            return _adapters.get(name)
+    return None
 
 def get_adapter(name: str) -> BaseAdapter:
-    """Get an adapter instance by name."""
-    if name not in _adapters:
+    """Get the shared adapter instance by name."""
+    adapter = _adapters.get(name)
+    if adapter is None:
+        adapter = _load_entry_point_adapter(name)
+    if adapter is None:
         raise KeyError(f"Adapter '{name}' not found. Available: {list(_adapters.keys())}")
-    return _adapters[name]()
+    return adapter
 
 # Register default adapters
 register_adapter(HttpxAdapter)
 
-__all__ = ["BaseAdapter", "HttpxAdapter", "register_adapter", "get_adapter"]
+# Shared instance for the default "httpx" adapter, bound directly by factories
+DEFAULT_ADAPTER: BaseAdapter = _adapters[HttpxAdapter.name]
+
+__all__ = ["BaseAdapter", "HttpxAdapter", "DEFAULT_ADAPTER", "register_adapter", "get_adapter"]
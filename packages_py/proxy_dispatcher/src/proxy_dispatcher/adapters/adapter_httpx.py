@@ -1,20 +1,87 @@
 """
 Adapter for httpx library.
 """
+import functools
+import importlib.util
 import logging
 import httpx
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple, Union
 from .base import BaseAdapter
 from ..models import DispatcherResult, ProxyConfig
 
+try:
+    import hishel
+    HISHEL_AVAILABLE = True
+except ImportError:
+    hishel = None
+    HISHEL_AVAILABLE = False
+
+# httpx only speaks HTTP/2 when the optional 'h2' package is installed
+H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 logger = logging.getLogger(__name__)
 
+# Set once the "http2 requested without h2" warning has been logged
+_h2_missing_warned = False
+
+def _warn_h2_missing() -> None:
+    """Log (once per process) that http2=True falls back to HTTP/1.1."""
+    global _h2_missing_warned
+    if not _h2_missing_warned:
+        _h2_missing_warned = True
+        logger.warning(
+            "http2=True requested but the 'h2' package is not installed; "
+            "using HTTP/1.1. Install the 'http2' extra to enable HTTP/2."
+        )
+
+@functools.lru_cache(maxsize=128)
+def _build_kwargs_items(
+    proxy_url: Optional[str],
+    verify_ssl: bool,
+    timeout: float,
+    trust_env: bool,
+    cert: Optional[Union[str, tuple]]
+) -> Tuple[Tuple[str, Any], ...]:
+    """Build (memoized) httpx client kwargs as an immutable tuple of items."""
+    kwargs: Dict[str, Any] = {
+        "timeout": timeout,
+        "verify": verify_ssl,
+    }
+
+    if proxy_url:
+        kwargs["proxy"] = proxy_url
+
+    if cert:
+        kwargs["cert"] = cert
+
+    # httpx specific: 'trust_env' defaults to True in httpx, but we control it
+    # Actually httpx uses 'trust_env', defaulting to True. 
+    # If we set it to False, it won't read env vars.
+    kwargs["trust_env"] = trust_env
+
+    return tuple(kwargs.items())
+
+@functools.lru_cache(maxsize=32)
+def _build_pool_kwargs_items(
+    max_connections: int,
+    max_keepalive: int,
+    http2: bool
+) -> Tuple[Tuple[str, Any], ...]:
+    """Build (memoized) client-only connection pool kwargs."""
+    if http2 and not H2_AVAILABLE:
+        _warn_h2_missing()
+    return (
+        ("limits", httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive
+        )),
+        ("http2", http2 and H2_AVAILABLE),
+    )
+
 class HttpxAdapter(BaseAdapter):
     """Adapter for httpx library."""
 
-    @property
-    def name(self) -> str:
-        return "httpx"
+    name = "httpx"
 
     def supports_sync(self) -> bool:
         return True
@@ -24,30 +91,29 @@ class HttpxAdapter(BaseAdapter):
 
     def get_proxy_dict(self, config: ProxyConfig) -> Dict[str, Any]:
         """Build kwargs for httpx client."""
-        kwargs: Dict[str, Any] = {
-            "timeout": config.timeout,
-            "verify": config.verify_ssl,
-        }
-        
-        if config.proxy_url:
-            kwargs["proxy"] = config.proxy_url
-            
-        if config.cert:
-            kwargs["cert"] = config.cert
-            
-        # httpx specific: 'trust_env' defaults to True in httpx, but we control it
-        # Actually httpx uses 'trust_env', defaulting to True. 
-        # If we set it to False, it won't read env vars.
-        kwargs["trust_env"] = config.trust_env
-
-        return kwargs
+        return dict(_build_kwargs_items(
+            config.proxy_url,
+            config.verify_ssl,
+            config.timeout,
+            config.trust_env,
+            config.cert
+        ))
+
+    def get_pool_dict(self, config: ProxyConfig) -> Dict[str, Any]:
+        """Build client-only kwargs (limits, http2) that per-request calls don't accept."""
+        return dict(_build_pool_kwargs_items(
+            config.max_connections,
+            config.max_keepalive,
+            config.http2
+        ))
 
     def create_sync_client(self, config: ProxyConfig) -> DispatcherResult:
         """Create httpx.Client."""
         kwargs = self.get_proxy_dict(config)
-        logger.debug(f"Creating httpx.Client with config: {kwargs}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Creating httpx.Client with config: %r", kwargs)
         
-        client = httpx.Client(**kwargs)
+        client = httpx.Client(**kwargs, **self.get_pool_dict(config))
         
         return DispatcherResult(
             client=client,
@@ -58,12 +124,44 @@ class HttpxAdapter(BaseAdapter):
     def create_async_client(self, config: ProxyConfig) -> DispatcherResult:
         """Create httpx.AsyncClient."""
         kwargs = self.get_proxy_dict(config)
-        logger.debug(f"Creating httpx.AsyncClient with config: {kwargs}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Creating httpx.AsyncClient with config: %r", kwargs)
         
-        client = httpx.AsyncClient(**kwargs)
+        pool_kwargs = self.get_pool_dict(config)
+        if config.response_cache is not None:
+            client = httpx.AsyncClient(
+                **self._with_cache_transport(kwargs, pool_kwargs, config.response_cache)
+            )
+        else:
+            client = httpx.AsyncClient(**kwargs, **pool_kwargs)
         
         return DispatcherResult(
             client=client,
             config=config,
             proxy_dict=kwargs
         )
+
+    def _with_cache_transport(
+        self,
+        kwargs: Dict[str, Any],
+        pool_kwargs: Dict[str, Any],
+        storage: Any
+    ) -> Dict[str, Any]:
+        """Route requests through an RFC 9111 caching transport backed by ``storage``.
+
+        The proxy is moved onto the inner transport: httpx mounts a separate
+        transport for ``proxy=``, which would otherwise bypass the cache.
+        """
+        if not HISHEL_AVAILABLE:
+            raise ImportError("hishel package is not installed. Install with 'pip install hishel'")
+
+        client_kwargs = dict(kwargs)
+        inner = httpx.AsyncHTTPTransport(
+            verify=client_kwargs["verify"],
+            cert=client_kwargs.get("cert"),
+            trust_env=client_kwargs["trust_env"],
+            proxy=client_kwargs.pop("proxy", None),
+            **pool_kwargs,
+        )
+        client_kwargs["transport"] = hishel.AsyncCacheTransport(transport=inner, storage=storage)
+        return client_kwargs
@@ -2,17 +2,17 @@
 Abstract base adapter for HTTP libraries.
 """
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, Optional
 from ..models import DispatcherResult, ProxyConfig
 
 class BaseAdapter(ABC):
-    """Abstract interface for HTTP library adapters."""
+    """Abstract interface for HTTP library adapters.
 
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Name of the adapter (e.g., 'httpx', 'requests')."""
-        pass
+    Adapters are stateless; the registry keeps a single shared instance each.
+    """
+
+    # Name of the adapter (e.g., 'httpx', 'requests'); set on each subclass.
+    name: ClassVar[str]
 
     @abstractmethod
     def supports_sync(self) -> bool:
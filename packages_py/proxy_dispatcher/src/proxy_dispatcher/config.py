@@ -1,5 +1,8 @@
 """
 Environment detection functions.
+
+These read os.environ on every call; ProxyDispatcherFactory keeps its own
+snapshot per instance (see ProxyDispatcherFactory.clear_cache()).
 """
 import os
 import logging
@@ -9,8 +12,8 @@ logger = logging.getLogger(__name__)
 
 def get_app_env(default: str = "dev") -> str:
     """Get the current application environment."""
-    env = os.getenv("APP_ENV", default)
-    logger.debug(f"Resolved APP_ENV: {env}")
+    env = os.environ.get("APP_ENV", default)
+    logger.debug("Resolved APP_ENV: %s", env)
     return env
 
 def is_dev() -> bool:
@@ -24,11 +27,11 @@ def is_prod() -> bool:
 def is_ssl_verify_disabled_by_env() -> bool:
     """Check if SSL verification is disabled by environment variables."""
     # Node.js compatibility
-    if os.getenv("NODE_TLS_REJECT_UNAUTHORIZED") == "0":
+    if os.environ.get("NODE_TLS_REJECT_UNAUTHORIZED") == "0":
         return True
     
     # Python convention
-    if os.getenv("SSL_CERT_VERIFY") == "0":
+    if os.environ.get("SSL_CERT_VERIFY") == "0":
         return True
         
     return False
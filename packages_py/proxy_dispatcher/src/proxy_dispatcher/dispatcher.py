@@ -1,13 +1,30 @@
 """
 Convenience functions for proxy dispatcher.
 """
+import atexit
+import threading
 from typing import Optional, Dict, Any, Union
 import httpx
 from .factory import ProxyDispatcherFactory
 from .models import FactoryConfig, DispatcherResult
 
-# Global default factory
-_default_factory = ProxyDispatcherFactory()
+# Global default factory, created on first use
+_default_factory: Optional[ProxyDispatcherFactory] = None
+_default_factory_lock = threading.Lock()
+
+def _get_default_factory() -> ProxyDispatcherFactory:
+    """Return the default factory, creating it on first call."""
+    global _default_factory
+    factory = _default_factory
+    if factory is None:
+        with _default_factory_lock:
+            factory = _default_factory
+            if factory is None:
+                factory = _default_factory = ProxyDispatcherFactory()
+                # Only sync clients are shared here (see get_async_client), and
+                # they can be closed without an event loop
+                atexit.register(factory.close)
+    return factory
 
 def get_proxy_dispatcher(
     environment: Optional[str] = None,
@@ -16,7 +33,7 @@ def get_proxy_dispatcher(
     async_client: bool = True
 ) -> DispatcherResult:
     """Get a configured HTTP client using the default factory."""
-    return _default_factory.get_proxy_dispatcher(
+    return _get_default_factory().get_proxy_dispatcher(
         environment=environment,
         disable_tls=disable_tls,
         timeout=timeout,
@@ -27,24 +44,42 @@ def get_async_client(
     disable_tls: Optional[bool] = None,
     timeout: float = 30.0
 ) -> httpx.AsyncClient:
-    """Get a configured async httpx client."""
-    result = get_proxy_dispatcher(disable_tls=disable_tls, timeout=timeout, async_client=True)
-    return result.client
+    """Get a new async httpx client; the caller owns it (use ``async with``).
+
+    Async clients are not shared here: their connections are bound to the
+    event loop they were opened on. For a long-lived client, use
+    ProxyDispatcherFactory.get_or_create_shared_async_client() from the
+    loop that will use it, and aclose() the factory on shutdown.
+    """
+    return _get_default_factory().get_proxy_dispatcher(
+        disable_tls=disable_tls,
+        timeout=timeout,
+        async_client=True
+    ).client
 
 def get_sync_client(
     disable_tls: Optional[bool] = None,
     timeout: float = 30.0
 ) -> httpx.Client:
-    """Get a configured sync httpx client."""
-    result = get_proxy_dispatcher(disable_tls=disable_tls, timeout=timeout, async_client=False)
-    return result.client
+    """Get the shared sync httpx client for these settings.
+
+    The client is owned by the default factory and shared by every caller
+    (and thread) asking for the same settings; it is closed at interpreter
+    exit. Do not close it or use it as a context manager (``with
+    get_sync_client() as c:`` closes it for everyone else). For a client
+    you own, use get_proxy_dispatcher(async_client=False).client.
+    """
+    return _get_default_factory().get_or_create_shared_sync_client(
+        disable_tls=disable_tls,
+        timeout=timeout
+    )
 
 def get_request_kwargs(
     timeout: float = 30.0,
     ca_bundle: Optional[str] = None
 ) -> Dict[str, Any]:
     """Get kwargs for direct request calls."""
-    return _default_factory.get_request_kwargs(timeout=timeout, ca_bundle=ca_bundle)
+    return _get_default_factory().get_request_kwargs(timeout=timeout, ca_bundle=ca_bundle)
 
 def create_proxy_dispatcher_factory(
     config: Optional[FactoryConfig] = None,
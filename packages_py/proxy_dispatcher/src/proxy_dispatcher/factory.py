@@ -2,14 +2,19 @@
 Factory for creating proxy-configured HTTP clients.
 """
 import logging
-from typing import Optional, Dict, Any, Union
+import threading
+from typing import Optional, Dict, Any, Tuple, Union
 from proxy_config import NetworkConfig, resolve_proxy_url
 from .models import FactoryConfig, ProxyConfig, DispatcherResult
 from .config import get_app_env, is_dev, is_ssl_verify_disabled_by_env
-from .adapters import get_adapter, BaseAdapter
+from .adapters import DEFAULT_ADAPTER, get_adapter, BaseAdapter
 
 logger = logging.getLogger(__name__)
 
+# Resolved ProxyConfigs kept per factory; timeouts are arbitrary floats, so the
+# cache is dropped once it reaches this size rather than growing without bound
+_DISPATCHER_CACHE_MAX = 64
+
 class ProxyDispatcherFactory:
     """Factory for creating proxy-configured HTTP clients."""
     
@@ -18,14 +23,60 @@ class ProxyDispatcherFactory:
         config: Optional[FactoryConfig] = None,
         adapter: str = "httpx"
     ):
-        self.config = config or FactoryConfig()
-        self.adapter: BaseAdapter = get_adapter(adapter)
+        self._config = config or FactoryConfig()
+        self._network_config = self._build_network_config(self._config)
+        self.adapter: BaseAdapter = (
+            DEFAULT_ADAPTER if adapter == DEFAULT_ADAPTER.name else get_adapter(adapter)
+        )
+
+        # Snapshot of resolved ProxyConfig keyed by (environment, timeout, disable_tls).
+        # Resolution reads env vars once per key; clients are still created per call
+        # since callers own (and close) them.
+        self._dispatcher_cache: Dict[Tuple[Optional[str], float, Optional[bool]], ProxyConfig] = {}
+        # Environment variables are read once per factory; clear_cache() re-reads them
+        self._app_env = get_app_env()
+        self._ssl_disabled_by_env = is_ssl_verify_disabled_by_env()
+
+        # Long-lived clients shared across callers, keyed by the resolved ProxyConfig
+        # value: equal settings reuse one pool even after clear_cache() rebuilds it.
+        self._shared_async_clients: Dict[ProxyConfig, DispatcherResult] = {}
+        self._shared_sync_clients: Dict[ProxyConfig, DispatcherResult] = {}
+        # Sync clients may be requested from several threads at once; creation is
+        # serialised so a racing caller can't orphan an unclosed client
+        self._shared_sync_lock = threading.Lock()
         
         # Load network config from app.yaml if available (would be passed in config usually)
         # For this implementation, we assume config is passed explicitly or resolves from env
         # In full integration, we'd load NetworkConfig here if not provided.
         
-        logger.debug(f"ProxyDispatcherFactory initialized with adapter '{adapter}'")
+        logger.debug("ProxyDispatcherFactory initialized with adapter '%s'", adapter)
+
+    @property
+    def config(self) -> FactoryConfig:
+        return self._config
+
+    @config.setter
+    def config(self, value: FactoryConfig) -> None:
+        self._config = value
+        self.clear_cache()
+
+    @staticmethod
+    def _build_network_config(config: FactoryConfig) -> NetworkConfig:
+        """Map FactoryConfig fields to the NetworkConfig the resolver expects."""
+        return NetworkConfig(
+            default_environment=config.default_environment,
+            proxy_urls=config.proxy_urls or {},
+            agent_proxy=config.agent_proxy,
+            cert=config.cert,
+            ca_bundle=config.ca_bundle
+        )
+
+    def clear_cache(self) -> None:
+        """Drop resolved proxy configs, e.g. after mutating config or env vars in place."""
+        self._network_config = self._build_network_config(self._config)
+        self._dispatcher_cache.clear()
+        self._app_env = get_app_env()
+        self._ssl_disabled_by_env = is_ssl_verify_disabled_by_env()
 
     def get_proxy_dispatcher(
         self,
@@ -35,24 +86,37 @@ class ProxyDispatcherFactory:
         async_client: bool = True
     ) -> DispatcherResult:
         """Get a configured HTTP client."""
+        proxy_config = self._resolve_proxy_config(environment, disable_tls, timeout)
         
+        # 5. Create Client via Adapter
+        if async_client:
+            if not self.adapter.supports_async():
+                raise NotImplementedError(f"Adapter '{self.adapter.name}' does not support async")
+            return self.adapter.create_async_client(proxy_config)
+        else:
+            if not self.adapter.supports_sync():
+                raise NotImplementedError(f"Adapter '{self.adapter.name}' does not support sync")
+            return self.adapter.create_sync_client(proxy_config)
+
+    def _resolve_proxy_config(
+        self,
+        environment: Optional[str],
+        disable_tls: Optional[bool],
+        timeout: float
+    ) -> ProxyConfig:
+        """Resolve (or return the cached) ProxyConfig for the given settings."""
+        key = (environment or self.config.default_environment, timeout, disable_tls)
+        cached = self._dispatcher_cache.get(key)
+        if cached is not None:
+            return cached
+
         # 1. Determine environment
-        target_env = environment or self.config.default_environment or get_app_env()
-        logger.debug(f"Target environment: {target_env}")
-
-        # 2. Resolve Proxy URL
-        # Build NetworkConfig-like structure from FactoryConfig for resolver
-        # This maps FactoryConfig fields to what resolver expects
-        network_config = NetworkConfig(
-            default_environment=self.config.default_environment,
-            proxy_urls=self.config.proxy_urls or {},
-            agent_proxy=self.config.agent_proxy,
-            cert=self.config.cert,
-            ca_bundle=self.config.ca_bundle
-        )
-        
+        target_env = environment or self.config.default_environment or self._app_env
+        logger.debug("Target environment: %s", target_env)
+
+        # 2. Resolve Proxy URL (NetworkConfig is built once from FactoryConfig)
         proxy_url = resolve_proxy_url(
-            network_config=network_config,
+            network_config=self._network_config,
             proxy_url_override=self.config.proxy_url
         )
 
@@ -64,7 +128,7 @@ class ProxyDispatcherFactory:
             verify_ssl = False
         elif self.config.cert_verify is not None:
             verify_ssl = self.config.cert_verify
-        elif is_ssl_verify_disabled_by_env():
+        elif self._ssl_disabled_by_env:
              verify_ssl = False
         # If we are in dev and trust_env is defaulting to false, we might want to disable verify
         # But generally verify should be true unless explicitly disabled.
@@ -76,18 +140,80 @@ class ProxyDispatcherFactory:
             timeout=timeout,
             trust_env=False, # We explicitly configure everything
             cert=self.config.cert,
-            ca_bundle=self.config.ca_bundle
+            ca_bundle=self.config.ca_bundle,
+            response_cache=self.config.response_cache,
+            max_connections=self.config.max_connections,
+            max_keepalive=self.config.max_keepalive,
+            http2=self.config.http2
         )
-        
-        # 5. Create Client via Adapter
-        if async_client:
-            if not self.adapter.supports_async():
-                raise NotImplementedError(f"Adapter '{self.adapter.name}' does not support async")
-            return self.adapter.create_async_client(proxy_config)
-        else:
-            if not self.adapter.supports_sync():
-                raise NotImplementedError(f"Adapter '{self.adapter.name}' does not support sync")
-            return self.adapter.create_sync_client(proxy_config)
+        if len(self._dispatcher_cache) >= _DISPATCHER_CACHE_MAX:
+            self._dispatcher_cache.clear()
+        self._dispatcher_cache[key] = proxy_config
+        return proxy_config
+
+    def get_or_create_shared_async_client(
+        self,
+        environment: Optional[str] = None,
+        disable_tls: Optional[bool] = None,
+        timeout: float = 30.0
+    ) -> Any:
+        """Get a long-lived async client that keeps its connection pool across calls.
+
+        Unlike get_proxy_dispatcher(), the returned client is owned by the factory:
+        callers must not close it (no ``async with``); call aclose() on shutdown.
+        """
+        proxy_config = self._resolve_proxy_config(environment, disable_tls, timeout)
+        result = self._shared_async_clients.get(proxy_config)
+        if result is None or result.client.is_closed:
+            result = self.get_proxy_dispatcher(
+                environment=environment,
+                disable_tls=disable_tls,
+                timeout=timeout,
+                async_client=True
+            )
+            self._shared_async_clients[proxy_config] = result
+        return result.client
+
+    def get_or_create_shared_sync_client(
+        self,
+        environment: Optional[str] = None,
+        disable_tls: Optional[bool] = None,
+        timeout: float = 30.0
+    ) -> Any:
+        """Sync counterpart of get_or_create_shared_async_client(); release with close().
+
+        Safe to call from multiple threads: at most one client is created per
+        resolved config.
+        """
+        proxy_config = self._resolve_proxy_config(environment, disable_tls, timeout)
+        result = self._shared_sync_clients.get(proxy_config)
+        if result is None or result.client.is_closed:
+            with self._shared_sync_lock:
+                result = self._shared_sync_clients.get(proxy_config)
+                if result is None or result.client.is_closed:
+                    result = self.get_proxy_dispatcher(
+                        environment=environment,
+                        disable_tls=disable_tls,
+                        timeout=timeout,
+                        async_client=False
+                    )
+                    self._shared_sync_clients[proxy_config] = result
+        return result.client
+
+    async def aclose(self) -> None:
+        """Close all shared async clients created by this factory."""
+        results = list(self._shared_async_clients.values())
+        self._shared_async_clients.clear()
+        for result in results:
+            await result.client.aclose()
+
+    def close(self) -> None:
+        """Close all shared sync clients created by this factory."""
+        with self._shared_sync_lock:
+            results = list(self._shared_sync_clients.values())
+            self._shared_sync_clients.clear()
+        for result in results:
+            result.client.close()
 
     def get_dispatcher_for_environment(
         self,
@@ -103,11 +229,9 @@ class ProxyDispatcherFactory:
         ca_bundle: Optional[str] = None
     ) -> Dict[str, Any]:
         """Get kwargs for direct request calls (e.g. httpx.get)."""
-        # Create a temp config to resolve settings
-        result = self.get_proxy_dispatcher(timeout=timeout, async_client=True) # async/sync doesn't matter for kwargs
-        return result.proxy_dict
+        # Build kwargs straight from the resolved config; no client is needed
+        return self.adapter.get_proxy_dict(self._resolve_proxy_config(None, None, timeout))
     
     def get_proxy_config(self) -> Dict[str, Any]:
         """Get configuration dictionary."""
-        result = self.get_proxy_dispatcher()
-        return result.proxy_dict
+        return self.adapter.get_proxy_dict(self._resolve_proxy_config(None, None, 30.0))
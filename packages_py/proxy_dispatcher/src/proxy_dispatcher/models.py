@@ -1,20 +1,51 @@
 """
 Data models for proxy dispatcher.
 """
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Any, Dict, Optional, Union
 from proxy_config import NetworkConfig, AgentProxyConfig
 
-@dataclass
+def _frozen_getstate(self) -> list:
+    return [getattr(self, name) for name in self.__slots__]
+
+def _frozen_setstate(self, state: list) -> None:
+    for name, value in zip(self.__slots__, state):
+        object.__setattr__(self, name, value)
+
+def _with_slots(cls):
+    """Recreate a dataclass with __slots__ for its fields.
+
+    Same result as dataclass(slots=True), which needs Python 3.10; field
+    defaults live on the class, so __slots__ can't be written in the body.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = {
+        key: value for key, value in cls.__dict__.items()
+        if key not in names and key not in ('__dict__', '__weakref__')
+    }
+    namespace['__slots__'] = names
+    if cls.__dataclass_params__.frozen:
+        # Default slot pickling restores state with setattr, which frozen classes reject
+        namespace['__getstate__'] = _frozen_getstate
+        namespace['__setstate__'] = _frozen_setstate
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+@_with_slots
+@dataclass(frozen=True)
 class ProxyConfig:
-    """Resolved proxy configuration for HTTP clients."""
+    """Resolved proxy configuration for HTTP clients (immutable, hashable)."""
     proxy_url: Optional[str] = None
     verify_ssl: bool = False
     timeout: float = 30.0
     trust_env: bool = False
     cert: Optional[Union[str, tuple]] = None
     ca_bundle: Optional[str] = None
+    response_cache: Any = None  # Optional hishel async storage
+    max_connections: int = 100
+    max_keepalive: int = 20
+    http2: bool = False
 
+@_with_slots
 @dataclass
 class FactoryConfig:
     """Configuration for ProxyDispatcherFactory."""
@@ -25,8 +56,17 @@ class FactoryConfig:
     cert: Optional[Union[str, tuple]] = None
     ca_bundle: Optional[str] = None
     cert_verify: Optional[bool] = None
+    # Opt-in HTTP response cache for async clients: a hishel async storage
+    # (e.g. hishel.AsyncFileStorage()). Requires the optional 'hishel' package.
+    response_cache: Any = None
+    # Connection pool tuning for created clients. HTTP/2 is opt-in and needs the
+    # optional 'h2' package (the 'http2' extra); without it clients use HTTP/1.1.
+    max_connections: int = 100
+    max_keepalive: int = 20
+    http2: bool = False
 
-@dataclass
+@_with_slots
+@dataclass(frozen=True)
 class DispatcherResult:
     """Result wrapper with client, config, and kwargs."""
     client: Any  # Union[httpx.Client, httpx.AsyncClient]
@@ -0,0 +1,16 @@
+"""
+Tests for environment detection.
+"""
+from proxy_dispatcher import get_app_env, is_dev, is_prod
+
+class TestEnvConfig:
+
+    def test_app_env_is_read_on_every_call(self, monkeypatch):
+        """Module-level helpers are uncached and follow os.environ."""
+        monkeypatch.setenv("APP_ENV", "prod")
+        assert get_app_env() == "prod"
+        assert is_prod() and not is_dev()
+
+        monkeypatch.setenv("APP_ENV", "dev")
+        assert get_app_env() == "dev"
+        assert is_dev()
@@ -1,9 +1,27 @@
 """
 Tests for ProxyDispatcherFactory.
 """
+import dataclasses
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 import httpx
-from proxy_dispatcher import ProxyDispatcherFactory, FactoryConfig
+from proxy_dispatcher import ProxyDispatcherFactory, FactoryConfig, get_async_client, get_sync_client, register_adapter
+from proxy_dispatcher import dispatcher
+from proxy_dispatcher import factory as factory_module
+
+
+@pytest.fixture
+def default_factory():
+    """Run against a fresh global default factory and drop it afterwards."""
+    dispatcher._default_factory = None
+    yield
+    factory = dispatcher._default_factory
+    dispatcher._default_factory = None
+    if factory is not None:
+        factory.close()
+
 
 class TestProxyDispatcherFactory:
     
@@ -43,3 +61,217 @@ class TestProxyDispatcherFactory:
         kwargs = factory.get_request_kwargs(timeout=10.0)
         assert kwargs["timeout"] == 10.0
         assert "proxy" not in kwargs # No proxy configured by default
+
+    def test_resolution_is_cached(self):
+        """Repeated calls should reuse the resolved ProxyConfig."""
+        factory = ProxyDispatcherFactory(config=FactoryConfig(proxy_url="http://override"))
+        first = factory.get_proxy_dispatcher(async_client=False)
+        second = factory.get_proxy_dispatcher(async_client=False)
+        assert first.config is second.config
+        assert first.client is not second.client
+
+        factory.config = FactoryConfig(proxy_url="http://other")
+        third = factory.get_proxy_dispatcher(async_client=False)
+        assert third.config.proxy_url == "http://other"
+
+    def test_ssl_disabled_by_env(self, monkeypatch):
+        """SSL env vars are read at construction and refreshed by clear_cache()."""
+        monkeypatch.setenv("SSL_CERT_VERIFY", "0")
+        factory = ProxyDispatcherFactory()
+        assert factory.get_proxy_dispatcher(async_client=False).config.verify_ssl is False
+
+        monkeypatch.delenv("SSL_CERT_VERIFY")
+        factory.clear_cache()
+        assert factory.get_proxy_dispatcher(async_client=False).config.verify_ssl is True
+
+    @pytest.mark.asyncio
+    async def test_shared_async_client(self):
+        """Shared clients are reused until closed by the factory."""
+        factory = ProxyDispatcherFactory()
+        client = factory.get_or_create_shared_async_client(timeout=5.0)
+        assert isinstance(client, httpx.AsyncClient)
+        assert factory.get_or_create_shared_async_client(timeout=5.0) is client
+        assert factory.get_or_create_shared_async_client(timeout=10.0) is not client
+
+        await factory.aclose()
+        assert client.is_closed
+        assert factory.get_or_create_shared_async_client(timeout=5.0) is not client
+        await factory.aclose()
+
+    def test_shared_client_survives_clear_cache(self):
+        """Equal resolved settings map to the same shared client after clear_cache()."""
+        factory = ProxyDispatcherFactory()
+        client = factory.get_or_create_shared_sync_client(timeout=5.0)
+        factory.clear_cache()
+        factory.config = FactoryConfig()
+
+        assert factory.get_or_create_shared_sync_client(timeout=5.0) is client
+        assert len(factory._shared_sync_clients) == 1
+        factory.close()
+
+    def test_dispatcher_cache_is_bounded(self):
+        """Resolving many distinct timeouts does not grow the cache without limit."""
+        factory = ProxyDispatcherFactory()
+        for i in range(500):
+            factory.get_request_kwargs(timeout=1.0 + i / 1000)
+        assert len(factory._dispatcher_cache) <= factory_module._DISPATCHER_CACHE_MAX
+
+    def test_adapter_instance_is_shared(self):
+        """Factories share the registered adapter instance."""
+        assert ProxyDispatcherFactory().adapter is ProxyDispatcherFactory().adapter
+
+    def test_request_kwargs_are_independent_copies(self):
+        """Callers may mutate returned kwargs without affecting later calls."""
+        factory = ProxyDispatcherFactory(config=FactoryConfig(proxy_url="http://override"))
+        kwargs = factory.get_request_kwargs(timeout=10.0)
+        kwargs["proxy"] = "http://mutated"
+        assert factory.get_request_kwargs(timeout=10.0)["proxy"] == "http://override"
+
+    def test_proxy_config_is_frozen(self):
+        """Resolved ProxyConfig is shared between results, so it must be immutable."""
+        result = ProxyDispatcherFactory().get_proxy_dispatcher(async_client=False)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.config.proxy_url = "http://mutated"
+        assert hash(result.config) == hash(result.config)
+
+    def test_models_are_slotted_and_picklable(self):
+        """Models carry __slots__ instead of a per-instance __dict__ and still pickle."""
+        import pickle
+        from proxy_dispatcher.models import ProxyConfig
+        config = ProxyConfig(proxy_url="http://p", timeout=5.0)
+        assert not hasattr(config, "__dict__")
+        assert not hasattr(FactoryConfig(), "__dict__")
+        assert pickle.loads(pickle.dumps(config)) == config
+
+    def test_clear_cache_picks_up_config_mutation(self):
+        """In-place FactoryConfig edits apply after clear_cache()."""
+        config = FactoryConfig(proxy_urls={"dev": "http://dev-proxy"}, default_environment="dev")
+        factory = ProxyDispatcherFactory(config=config)
+        assert factory.get_request_kwargs()["proxy"] == "http://dev-proxy"
+
+        config.proxy_urls = {"dev": "http://new-dev-proxy"}
+        factory.clear_cache()
+        assert factory.get_request_kwargs()["proxy"] == "http://new-dev-proxy"
+
+    @pytest.mark.asyncio
+    async def test_response_cache_transport(self):
+        """Opting into response_cache wraps the async transport in a hishel cache."""
+        hishel = pytest.importorskip("hishel")
+        config = FactoryConfig(proxy_url="http://override:3128", response_cache=hishel.AsyncInMemoryStorage())
+        factory = ProxyDispatcherFactory(config=config)
+        client = factory.get_or_create_shared_async_client()
+        assert isinstance(client._transport, hishel.AsyncCacheTransport)
+        # Proxy lives on the inner transport so cached requests are not bypassed
+        assert not client._mounts
+        await factory.aclose()
+
+    def test_register_adapter_is_idempotent(self):
+        """Re-registering the same class keeps the existing instance."""
+        from proxy_dispatcher.adapters import get_adapter, HttpxAdapter
+        adapter = get_adapter("httpx")
+        register_adapter(HttpxAdapter)
+        assert get_adapter("httpx") is adapter
+
+    def test_unknown_adapter(self):
+        """Unknown adapter names raise KeyError after entry points are checked."""
+        with pytest.raises(KeyError):
+            ProxyDispatcherFactory(adapter="does-not-exist")
+
+    def test_pool_limits(self):
+        """Connection limits from FactoryConfig reach the client, not the request kwargs."""
+        factory = ProxyDispatcherFactory(config=FactoryConfig(max_connections=7, max_keepalive=3))
+        result = factory.get_proxy_dispatcher(async_client=False)
+        pool = result.client._transport._pool
+        assert pool._max_connections == 7
+        assert pool._max_keepalive_connections == 3
+        assert "limits" not in factory.get_request_kwargs()
+        result.client.close()
+
+    def test_http2_is_opt_in(self):
+        """HTTP/2 stays off unless requested and the optional h2 package is installed."""
+        from proxy_dispatcher.adapters.adapter_httpx import H2_AVAILABLE
+        factory = ProxyDispatcherFactory()
+        result = factory.get_proxy_dispatcher(async_client=False)
+        assert result.config.http2 is False
+        assert factory.adapter.get_pool_dict(result.config)["http2"] is False
+        result.client.close()
+
+        opted_in = ProxyDispatcherFactory(config=FactoryConfig(http2=True))
+        result = opted_in.get_proxy_dispatcher(async_client=False)
+        assert opted_in.adapter.get_pool_dict(result.config)["http2"] is H2_AVAILABLE
+        result.client.close()
+
+    def test_http2_without_h2_warns_once(self, monkeypatch, caplog):
+        """Requesting HTTP/2 without h2 logs a single fallback warning."""
+        from proxy_dispatcher.adapters import adapter_httpx
+        from proxy_dispatcher.models import ProxyConfig
+        monkeypatch.setattr(adapter_httpx, "H2_AVAILABLE", False)
+        monkeypatch.setattr(adapter_httpx, "_h2_missing_warned", False)
+        adapter_httpx._build_pool_kwargs_items.cache_clear()
+        try:
+            adapter = ProxyDispatcherFactory().adapter
+            with caplog.at_level("WARNING", logger=adapter_httpx.__name__):
+                for max_connections in (10, 20):
+                    config = ProxyConfig(http2=True, max_connections=max_connections)
+                    assert adapter.get_pool_dict(config)["http2"] is False
+        finally:
+            adapter_httpx._build_pool_kwargs_items.cache_clear()
+
+        assert [r.getMessage() for r in caplog.records].count(
+            "http2=True requested but the 'h2' package is not installed; "
+            "using HTTP/1.1. Install the 'http2' extra to enable HTTP/2."
+        ) == 1
+
+    def test_proxy_config_does_not_create_client(self, monkeypatch):
+        """Metadata helpers build kwargs without constructing a client."""
+        factory = ProxyDispatcherFactory(config=FactoryConfig(proxy_url="http://override"))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("client should not be created")
+
+        monkeypatch.setattr(factory.adapter, "create_async_client", fail)
+        monkeypatch.setattr(factory.adapter, "create_sync_client", fail)
+        assert factory.get_proxy_config()["proxy"] == "http://override"
+        assert factory.get_request_kwargs()["proxy"] == "http://override"
+
+    def test_convenience_clients_are_shared(self, default_factory):
+        """get_sync_client() reuses one client and replaces it once closed."""
+        client = get_sync_client(timeout=12.0)
+        assert get_sync_client(timeout=12.0) is client
+        client.close()
+        assert get_sync_client(timeout=12.0) is not client
+
+    def test_shared_sync_client_created_once_across_threads(self, monkeypatch):
+        """Concurrent first calls share one client instead of orphaning extras."""
+        factory = ProxyDispatcherFactory()
+        create = factory.adapter.create_sync_client
+        barrier = threading.Barrier(8)
+        created = []
+
+        def slow_create(proxy_config):
+            result = create(proxy_config)
+            created.append(result.client)
+            time.sleep(0.01)
+            return result
+
+        monkeypatch.setattr(factory.adapter, "create_sync_client", slow_create)
+
+        def worker():
+            barrier.wait()
+            return factory.get_or_create_shared_sync_client(timeout=7.0)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            clients = list(pool.map(lambda _: worker(), range(8)))
+
+        assert len(created) == 1
+        assert all(client is created[0] for client in clients)
+        factory.close()
+
+    @pytest.mark.asyncio
+    async def test_convenience_async_client_is_caller_owned(self, default_factory):
+        """get_async_client() hands out a new client each call, never a cross-loop shared one."""
+        async with get_async_client(timeout=12.0) as first:
+            second = get_async_client(timeout=12.0)
+            assert second is not first
+            await second.aclose()
+        assert first.is_closed
@@ -10,32 +10,32 @@ def resolve(template: str, context: Dict[str, Any]) -> str:
     """
     if not template:
         return ""
+
+    # Fast path: no sigils means nothing to substitute or unescape
+    # (escaped forms \$. and \{{ contain the same sigils).
+    if "{{" not in template and "$." not in template:
+        return template
         
-    result = template
-    
-    # Process mustache syntax {{path}}
-    def replace_mustache(match):
-        path = match.group(1).strip()
-        default_val = match.group(2)
-        val = resolve_path(context, path)
-        if val is None:
-            return default_val if default_val is not None else match.group(0)
-        return coerce_to_string(val)
-        
-    result = PATTERNS["MUSTACHE"].sub(replace_mustache, result)
-    
-    # Process dot path syntax $.path
-    def replace_dot(match):
-        path = match.group(1)
-        val = resolve_path(context, path)
+    # Process {{path}} and $.path in a single scan. Substituted values are
+    # not rescanned, so a value containing "$.x" is inserted literally.
+    def replace_placeholder(match):
+        if match.lastgroup == "MUSTACHE":
+            path = match.group(2).strip()
+            default_val = match.group(3)
+            val = resolve_path(context, path)
+            if val is None:
+                return default_val if default_val is not None else match.group(0)
+            return coerce_to_string(val)
+        val = resolve_path(context, match.group(5))
         if val is None:
             return match.group(0) # Keep literal if not found (simple default for now)
         return coerce_to_string(val)
-        
-    result = PATTERNS["DOT_PATH"].sub(replace_dot, result)
+
+    result = PATTERNS["PLACEHOLDER"].sub(replace_placeholder, template)
     
     # Restore escaped placeholders
-    result = PATTERNS["ESCAPED_DOT"].sub("$.", result)
-    result = PATTERNS["ESCAPED_MUSTACHE"].sub("{{", result)
+    if "\\" in result:
+        result = PATTERNS["ESCAPED_DOT"].sub("$.", result)
+        result = PATTERNS["ESCAPED_MUSTACHE"].sub("{{", result)
     
     return result
@@ -1,10 +1,22 @@
-from typing import Any
+from typing import Any, Callable, Dict
 import json
 
+_COERCERS: Dict[type, Callable[[Any], str]] = {
+    str: lambda v: v,
+    int: str,
+    float: str,
+    bool: lambda v: "true" if v else "false",
+    dict: json.dumps,
+    list: json.dumps,
+    type(None): lambda v: "",
+}
+
 def coerce_to_string(value: Any) -> str:
     """Convert value to string for template replacement."""
-    if value is None:
-        return ""
+    fn = _COERCERS.get(type(value))
+    if fn is not None:
+        return fn(value)
+    # Subclasses (OrderedDict, IntEnum, ...) take the slower isinstance path
     if isinstance(value, (dict, list)):
         return json.dumps(value)
     if isinstance(value, bool):
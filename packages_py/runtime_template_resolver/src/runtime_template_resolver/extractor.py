@@ -5,26 +5,33 @@ def extract_placeholders(template: str) -> List[Dict[str, Any]]:
     """Extract all placeholders from a template string."""
     placeholders = []
     
-    # Extract mustache placeholders
-    for match in PATTERNS["MUSTACHE"].finditer(template):
+    # Extract mustache and dot path placeholders in one pass, in template order
+    for match in PATTERNS["PLACEHOLDER"].finditer(template):
+        if match.lastgroup == "MUSTACHE":
+            path = match.group(2).strip()
+            default = match.group(3)
+        else:
+            path = match.group(5)
+            default = None
         placeholders.append({
             "raw": match.group(0),
-            "path": match.group(1).strip(),
-            "default": match.group(2),
+            "path": path,
+            "default": default,
             "start": match.start(),
             "end": match.end(),
-            "syntax": "MUSTACHE"
-        })
-        
-    # Extract dot path placeholders
-    for match in PATTERNS["DOT_PATH"].finditer(template):
-        placeholders.append({
-            "raw": match.group(0),
-            "path": match.group(1),
-            "default": None,
-            "start": match.start(),
-            "end": match.end(),
-            "syntax": "DOT_PATH"
+            "syntax": match.lastgroup
         })
+        if match.lastgroup == "MUSTACHE":
+            # The single scan consumes the whole mustache; dot paths written
+            # inside it (e.g. "{{ $.a }}") are still reported after it
+            for inner in PATTERNS["DOT_PATH"].finditer(template, match.start(), match.end()):
+                placeholders.append({
+                    "raw": inner.group(0),
+                    "path": inner.group(1),
+                    "default": None,
+                    "start": inner.start(),
+                    "end": inner.end(),
+                    "syntax": "DOT_PATH"
+                })
         
     return placeholders
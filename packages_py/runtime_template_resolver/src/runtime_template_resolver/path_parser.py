@@ -1,6 +1,11 @@
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 import re
 
+# One token per segment: ['quoted'], ["quoted"], [index] or a bare name.
+# Quoted keys may be empty; empty brackets and empty names are skipped.
+_TOKEN = re.compile(r"""\[(?:'([^']*)'|"([^"]*)"|([^\]]*))\]|([^.\[\]]+)""")
+
 def parse_path(path: str) -> List[str]:
     """
     Parse a path string into segments.
@@ -14,49 +19,23 @@ def parse_path(path: str) -> List[str]:
         return path.split('.')
         
     segments = []
-    current = ""
-    in_bracket = False
-    in_quote = False
-    quote_char = None
-    
-    i = 0
-    while i < len(path):
-        char = path[i]
-        
-        if in_quote:
-            if char == quote_char:
-                in_quote = False
-                quote_char = None
-                segments.append(current)
-                current = ""
-            else:
-                current += char
-        elif in_bracket:
-            if char == '"' or char == "'":
-                in_quote = True
-                quote_char = char
-            elif char == ']':
-                in_bracket = False
-                if current: # was numeric index
-                    segments.append(current)
-                    current = ""
-            else:
-                current += char
-        else: # Normal state
-            if char == '.':
-                if current:
-                    segments.append(current)
-                    current = ""
-            elif char == '[':
-                if current:
-                    segments.append(current)
-                    current = ""
-                in_bracket = True
-            else:
-                current += char
-        i += 1
-        
-    if current:
-        segments.append(current)
+    for match in _TOKEN.finditer(path):
+        single, double, index, name = match.groups()
+        if single is not None:
+            segments.append(single)
+        elif double is not None:
+            segments.append(double)
+        elif index:
+            segments.append(index)
+        elif name:
+            segments.append(name)
         
     return segments
+
+@lru_cache(maxsize=4096)
+def parse_path_cached(path: str) -> Tuple[str, ...]:
+    """
+    Memoized parse_path for hot paths; returns an immutable tuple of segments.
+    Paths are short and heavily repeated across renders.
+    """
+    return tuple(parse_path(path))
@@ -1,11 +1,20 @@
 import re
 
+_DOT_PATH = r'\$\.([a-zA-Z_]\w*(?:\.\w+|\[\d+\]|\["[^"]+"\]|\[\'[^ \']+\'\])*)'
+_MUSTACHE = r'\{\{([^}|]+)(?:\|"([^"]*)")?\}\}'
+
 PATTERNS = {
     # $.path.to.value
-    "DOT_PATH": re.compile(r'\$\.([a-zA-Z_]\w*(?:\.\w+|\[\d+\]|\["[^"]+"\]|\[\'[^ \']+\'\])*)'),
+    "DOT_PATH": re.compile(_DOT_PATH),
 
     # {{path.to.value}} or {{path|"default"}}
-    "MUSTACHE": re.compile(r'\{\{([^}|]+)(?:\|"([^"]*)")?\}\}'),
+    "MUSTACHE": re.compile(_MUSTACHE),
+
+    # Either syntax in a single scan; dispatch on match.lastgroup.
+    # Groups: 2=mustache path, 3=mustache default, 5=dot path.
+    "PLACEHOLDER": re.compile(
+        r'(?P<MUSTACHE>' + _MUSTACHE + r')|(?P<DOT_PATH>' + _DOT_PATH + r')'
+    ),
 
     # Escaped variants
     "ESCAPED_DOT": re.compile(r'\\\$\.'),
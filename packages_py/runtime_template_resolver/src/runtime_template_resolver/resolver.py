@@ -1,5 +1,7 @@
 from typing import Any
-from .path_parser import parse_path
+from .path_parser import parse_path_cached
+
+_MISSING = object()
 
 class SecurityError(Exception):
     pass
@@ -9,7 +11,7 @@ def resolve_path(obj: Any, path: str) -> Any:
     Safely resolve a value from a nested object using a path string.
     Does not use eval(). Prevents access to private attributes (starting with _).
     """
-    segments = parse_path(path)
+    segments = parse_path_cached(path)
     current = obj
 
     for segment in segments:
@@ -20,17 +22,18 @@ def resolve_path(obj: Any, path: str) -> Any:
         if segment.startswith('_'):
              raise SecurityError(f"Unsafe path segment: {segment}")
 
-        if isinstance(current, dict):
+        # Exact type() checks short-circuit the common case before isinstance()
+        if type(current) is dict or isinstance(current, dict):
             current = current.get(segment)
-        elif isinstance(current, (list, tuple)):
+        elif type(current) is list or isinstance(current, (list, tuple)):
             if segment.isdigit():
                 idx = int(segment)
                 current = current[idx] if idx < len(current) else None
             else:
                 return None
-        elif hasattr(current, segment):
-            current = getattr(current, segment)
         else:
-            return None
+            current = getattr(current, segment, _MISSING)
+            if current is _MISSING:
+                return None
 
     return current
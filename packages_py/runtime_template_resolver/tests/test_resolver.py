@@ -1,7 +1,9 @@
 import pytest
+from runtime_template_resolver import resolve
 from runtime_template_resolver.resolver import resolve_path, SecurityError
 from runtime_template_resolver.extractor import extract_placeholders
-from runtime_template_resolver.path_parser import parse_path
+from runtime_template_resolver.path_parser import parse_path, parse_path_cached
+from runtime_template_resolver.coercion import coerce_to_string
 
 class TestResolver:
     def test_simple_dict(self):
@@ -46,8 +48,60 @@ class TestExtractor:
         assert placeholders[0]["path"] == "path.to.val"
         assert placeholders[0]["syntax"] == "DOT_PATH"
 
+    def test_extract_mixed_in_template_order(self):
+        placeholders = extract_placeholders('$.a and {{b|"d"}}')
+        assert [p["syntax"] for p in placeholders] == ["DOT_PATH", "MUSTACHE"]
+        assert placeholders[1]["default"] == "d"
+
+    def test_extract_dot_path_nested_in_mustache(self):
+        placeholders = extract_placeholders('{{ $.a }} $.b')
+        assert [(p["syntax"], p["raw"]) for p in placeholders] == [
+            ("MUSTACHE", "{{ $.a }}"),
+            ("DOT_PATH", "$.a"),
+            ("DOT_PATH", "$.b"),
+        ]
+        assert (placeholders[1]["start"], placeholders[1]["end"]) == (3, 6)
+
 class TestPathParser:
     def test_parse_path(self):
         assert parse_path("a.b.c") == ["a", "b", "c"]
         assert parse_path("a[0].c") == ["a", "0", "c"]
         assert parse_path("a['b'].c") == ["a", "b", "c"]
+        assert parse_path('h["X-Api.Key"][2]') == ["h", "X-Api.Key", "2"]
+        assert parse_path("x[''].y") == ["x", "", "y"]
+
+    def test_parse_path_cached(self):
+        assert parse_path_cached("a[0].c") == ("a", "0", "c")
+        assert parse_path_cached("a[0].c") is parse_path_cached("a[0].c")
+        # The uncached variant still hands out independent lists
+        assert parse_path("a.b") is not parse_path("a.b")
+
+class TestCoercion:
+    def test_common_types(self):
+        assert coerce_to_string(None) == ""
+        assert coerce_to_string(True) == "true"
+        assert coerce_to_string(False) == "false"
+        assert coerce_to_string(3) == "3"
+        assert coerce_to_string("x") == "x"
+        assert coerce_to_string({"a": [1]}) == '{"a": [1]}'
+
+    def test_subclasses_use_fallback(self):
+        from collections import OrderedDict
+        assert coerce_to_string(OrderedDict(a=1)) == '{"a": 1}'
+        assert coerce_to_string((1, 2)) == "(1, 2)"
+
+class TestResolve:
+    def test_passthrough_without_sigils(self):
+        tpl = "static header value"
+        assert resolve(tpl, {"a": 1}) is tpl
+
+    def test_mustache_and_dot(self):
+        ctx = {"user": {"name": "alice"}, "n": 2}
+        assert resolve("Hi {{user.name}} #$.n", ctx) == "Hi alice #2"
+        assert resolve('{{missing|"anon"}}', ctx) == "anon"
+
+    def test_escaped_mustache(self):
+        assert resolve("\\{{literal}}", {}) == "{{literal}}"
+
+    def test_substituted_values_are_not_rescanned(self):
+        assert resolve("{{a}}", {"a": "$.b", "b": "x"}) == "$.b"
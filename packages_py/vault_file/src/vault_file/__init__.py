@@ -2,7 +2,7 @@ from .domain import VaultHeader, VaultMetadata, VaultPayload, LoadResult
 from .core import VaultFile
 from .validators import VaultValidationError, VaultSerializationError
 from .env_store import EnvStore, EnvKeyNotFoundError, env, Base64FileParser, ComputedDefinition
-from .logger import VaultFileLogger, get_logger, set_log_level, get_log_level
+from .logger import VaultFileLogger, get_logger, set_log_level, get_log_level, is_enabled
 from .sensitive import mask_value, set_log_mask
 
 __all__ = [
@@ -22,6 +22,7 @@ __all__ = [
     "get_logger",
     "set_log_level",
     "get_log_level",
+    "is_enabled",
     "mask_value",
     "set_log_mask"
 ]
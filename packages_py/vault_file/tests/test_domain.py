@@ -0,0 +1,20 @@
+from dataclasses import asdict
+from datetime import datetime
+from vault_file import VaultHeader
+
+
+def test_header_to_dict_follows_created_at_assignment():
+    header = VaultHeader(created_at=datetime(2024, 1, 1))
+    assert header.to_dict()["created_at"] == "2024-01-01T00:00:00"
+
+    header.created_at = datetime(2025, 6, 1, 12, 30)
+
+    assert header.to_dict()["created_at"] == "2025-06-01T12:30:00"
+
+
+def test_header_fields_are_only_the_public_ones():
+    header = VaultHeader(id="a", created_at=datetime(2024, 1, 1))
+    header.to_dict()
+
+    assert list(asdict(header)) == ["id", "version", "created_at"]
+    assert header == VaultHeader(id="a", created_at=datetime(2024, 1, 1))
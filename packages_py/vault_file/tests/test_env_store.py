@@ -0,0 +1,103 @@
+import os
+import pytest
+from vault_file import EnvStore
+
+
+@pytest.fixture
+def store():
+    instance = EnvStore()
+    instance.reset()
+    yield instance
+    instance.reset()
+
+
+def test_get_all_returns_a_dict_snapshot(store, tmp_path, monkeypatch):
+    monkeypatch.setenv("VAULT_TEST_SHARED", "from-env")
+    (tmp_path / ".env").write_text("VAULT_TEST_SHARED=from-file\nVAULT_TEST_ONLY_FILE=1\n")
+    store.load(str(tmp_path / ".env"), override=True, mirror_to_environ=False)
+
+    merged = store.get_all()
+    merged["VAULT_TEST_ONLY_FILE"] = "changed"
+
+    assert type(merged) is dict
+    assert merged["VAULT_TEST_SHARED"] == "from-file"
+    assert store.get("VAULT_TEST_ONLY_FILE") == "1"
+    assert os.environ["VAULT_TEST_SHARED"] == "from-env"
+
+
+def test_load_result_lists_loaded_files_once(store, tmp_path):
+    (tmp_path / ".env").write_text("VAULT_TEST_A=1\n")
+    (tmp_path / ".env.local").write_text("VAULT_TEST_B=2\n")
+
+    result = store.load(str(tmp_path), mirror_to_environ=False)
+
+    expected = (str(tmp_path / ".env"), str(tmp_path / ".env.local"))
+    assert tuple(result.files_loaded) == expected
+    assert store.get_load_result() == {"loaded_files": expected, "store_size": 2}
+
+
+def test_load_matches_dotenv_values(store, tmp_path):
+    from dotenv import dotenv_values
+
+    env_file = tmp_path / ".env"
+    env_file.write_text("VAULT_TEST_PLAIN=1\nVAULT_TEST_QUOTED='a b'\nexport VAULT_TEST_EXPORTED=2 # note\n")
+
+    store.load(str(env_file), override=True, mirror_to_environ=False)
+
+    for key, value in dotenv_values(str(env_file)).items():
+        assert store.get(key) == value
+
+
+def test_reload_picks_up_changed_file(store, tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("VAULT_TEST_A=1\n")
+    store.load(str(env_file), override=True, mirror_to_environ=False)
+
+    env_file.write_text("VAULT_TEST_A=22\n")
+    store.load(str(env_file), override=True, mirror_to_environ=False)
+
+    assert store.get("VAULT_TEST_A") == "22"
+
+
+def test_directory_pattern_skips_hidden_files_unless_requested(store, tmp_path):
+    (tmp_path / ".env").write_text("VAULT_TEST_HIDDEN=1\n")
+    (tmp_path / "app.env").write_text("VAULT_TEST_VISIBLE=1\n")
+
+    result = store.load(str(tmp_path), pattern="*env", mirror_to_environ=False)
+
+    assert result.files_loaded == [str(tmp_path / "app.env")]
+
+
+def test_base64_parser_output_is_flattened(store, tmp_path, monkeypatch):
+    monkeypatch.setenv("VAULT_TEST_SRC", "present")
+    (tmp_path / ".env").write_text("")
+
+    def parser(env_store):
+        return {"db": {"host": "localhost", "ports": [1, {"x": 2}], "skip": None}}
+
+    store.load(str(tmp_path / ".env"), base64_file_parsers={"VAULT_TEST_SRC": parser}, mirror_to_environ=False)
+
+    assert store.get("VAULT_TEST_SRC_DB_HOST") == "localhost"
+    assert store.get("VAULT_TEST_SRC_DB_PORTS_0") == "1"
+    assert store.get("VAULT_TEST_SRC_DB_PORTS_1_X") == "2"
+    assert store.get("VAULT_TEST_SRC_DB_SKIP") is None
+
+
+def test_computed_values_are_recomputed_after_a_load_writes(store, tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("VAULT_TEST_N=1\n")
+    calls = []
+
+    def doubled(env_store):
+        calls.append(1)
+        return int(env_store.get("VAULT_TEST_N")) * 2
+
+    store.load(str(env_file), computed_definitions={"doubled": doubled}, mirror_to_environ=False)
+    assert store.get_computed("doubled") == 2
+    assert store.get_computed("doubled") == 2
+
+    env_file.write_text("VAULT_TEST_N=50\n")
+    store.load(str(env_file), override=True, mirror_to_environ=False)
+
+    assert store.get_computed("doubled") == 100
+    assert len(calls) == 2
@@ -0,0 +1,49 @@
+import pytest
+from vault_file import get_logger, set_log_level, get_log_level, is_enabled
+
+
+@pytest.fixture(autouse=True)
+def restore_level():
+    previous = get_log_level()
+    yield
+    set_log_level(previous)
+
+
+def test_threshold_follows_set_log_level(capsys):
+    logger = get_logger()
+
+    set_log_level("warn")
+    logger.info("hidden")
+    logger.warn("shown")
+    assert is_enabled("warn") and not is_enabled("info")
+
+    set_log_level("debug")
+    logger.debug("now shown")
+    assert logger.is_enabled("debug") and not logger.is_enabled("trace")
+
+    captured = capsys.readouterr()
+    assert captured.out == "[vault-file] now shown\n"
+    assert captured.err == "[vault-file] shown\n"
+
+
+def test_silent_drops_everything(capsys):
+    set_log_level("silent")
+    logger = get_logger()
+    logger.error("dropped")
+    logger.trace("dropped")
+
+    assert capsys.readouterr() == ("", "")
+
+
+def test_unknown_level_is_ignored():
+    set_log_level("info")
+    set_log_level("verbose")
+
+    assert get_log_level() == "info"
+
+
+def test_extra_args_are_joined(capsys):
+    set_log_level("info")
+    get_logger().info("values:", 1, "two")
+
+    assert capsys.readouterr().out == "[vault-file] values: 1 two\n"
@@ -0,0 +1,47 @@
+import pytest
+from io import StringIO
+from dotenv import dotenv_values
+from vault_file.core import _parse_properties, _parse_simple_properties
+
+
+PLAIN_SAMPLES = [
+    "",
+    "A=1\nB=two\n",
+    "\ufeffA=1\nB=2",
+    "# comment\n\nKEY = value with spaces  \r\nOTHER=\n",
+    "QUOTED='single'\nDOUBLE=\"double quoted\"\n",
+    "EQ==starts-with-equals\nURL=https://example.com/a?b=c\n",
+    "UNICODE=café\n",
+    "A=1\rB=2\r\n",
+]
+
+# Syntax only dotenv's full parser handles
+COMPLEX_SAMPLES = [
+    "export A=1\n",
+    "A=1 # trailing comment\n",
+    "A=${B}\nB=2\n",
+    "A=\"line\\nbreak\"\n",
+    "A=1\x0cB=2\n",
+    "KEY#X=1\n",
+    "NOVALUE\n",
+]
+
+
+@pytest.mark.parametrize("text", PLAIN_SAMPLES + COMPLEX_SAMPLES)
+def test_parse_properties_matches_dotenv(text):
+    assert _parse_properties(text) == dict(dotenv_values(stream=StringIO(text)))
+
+
+@pytest.mark.parametrize("text", PLAIN_SAMPLES)
+def test_plain_samples_take_the_fast_path(text):
+    assert _parse_simple_properties(text) is not None
+
+
+@pytest.mark.parametrize("text", COMPLEX_SAMPLES)
+def test_complex_samples_defer_to_dotenv(text):
+    assert _parse_simple_properties(text) is None
+
+
+def test_fast_path_handles_leading_bom():
+    assert _parse_simple_properties("\ufeffA=1") == {"A": "1"}
+
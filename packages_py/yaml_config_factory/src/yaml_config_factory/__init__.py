@@ -1,6 +1,7 @@
 from .factory import (
     YamlConfigFactory, 
     ComputeResult, 
+    LazyComputeResult,
     ComputeOptions, 
     NetworkConfig
 )
@@ -11,11 +12,12 @@ from .compute_registry import (
     register_startup,
     register_request
 )
-from .context_resolver import ContextResolver, resolve_deep
+from .context_resolver import ContextResolver, ContextOverlayPlan, resolve_deep
 
 __all__ = [
     "YamlConfigFactory",
     "ComputeResult",
+    "LazyComputeResult",
     "ComputeOptions",
     "NetworkConfig",
     "create_runtime_config_response",
@@ -25,5 +27,6 @@ __all__ = [
     "register_startup",
     "register_request",
     "ContextResolver",
+    "ContextOverlayPlan",
     "resolve_deep"
 ]
@@ -7,6 +7,8 @@ class ContextComputeRegistry:
 
     _startup_resolvers: Dict[str, Callable] = {}
     _request_resolvers: Dict[str, Callable] = {}
+    # Whether a request resolver takes a 'request' keyword, worked out once per function
+    _accepts_request: Dict[Callable, bool] = {}
 
     @classmethod
     def register_startup(cls, name: str):
@@ -21,6 +23,7 @@ class ContextComputeRegistry:
         """Decorator to register a request-time resolver."""
         def decorator(fn: Callable):
             cls._request_resolvers[name] = fn
+            cls._accepts_request[fn] = 'request' in inspect.signature(fn).parameters
             return fn
         return decorator
 
@@ -31,8 +34,11 @@ class ContextComputeRegistry:
         if name in cls._request_resolvers:
             fn = cls._request_resolvers[name]
             # Check if function accepts request arg
-            sig = inspect.signature(fn)
-            if 'request' in sig.parameters:
+            accepts_request = cls._accepts_request.get(fn)
+            if accepts_request is None:
+                # Registered without the decorator; inspect once and remember
+                accepts_request = cls._accepts_request[fn] = 'request' in inspect.signature(fn).parameters
+            if accepts_request:
                 result = fn(context, request=request)
             else:
                 result = fn(context)
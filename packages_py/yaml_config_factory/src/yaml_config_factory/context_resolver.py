@@ -1,94 +1,411 @@
-from typing import Any, Dict, Set, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Set, Tuple, Optional
 from runtime_template_resolver import resolve
-from copy import deepcopy
 from .compute_registry import ContextComputeRegistry
+import asyncio
 import re
 
 # Pattern to detect template types
 TEMPLATE_PATTERN = re.compile(r'\{\{[^}]+\}\}|\$\.[a-zA-Z_]')
 FUNCTION_PATTERN = re.compile(r'^\{\{fn:([a-zA-Z_][a-zA-Z0-9_]*)\}\}$')
+# Both of the above in one pass: a whole-string function ref fills the 'fn'
+# group, any other template match leaves it empty
+CLASSIFY_PATTERN = re.compile(
+    r'^\{\{fn:(?P<fn>[a-zA-Z_]\w*)\}\}$|\{\{[^}]+\}\}|\$\.[a-zA-Z_]',
+    re.ASCII
+)
+
+def classify(value: str) -> tuple[str, Optional[str]]:
+    """Classify a value as ('fn', resolver_name), ('tpl', None) or ('plain', None)."""
+    # Substring checks reject the common plain string without entering the regex engine
+    if not value or ('{{' not in value and '$.' not in value):
+        return 'plain', None
+    match = CLASSIFY_PATTERN.search(value.strip())
+    if match is None:
+        return 'plain', None
+    name = match.group('fn')
+    if name is not None:
+        return 'fn', name
+    return 'tpl', None
 
 def has_template(value: str) -> bool:
-    if not value:
-        return False
-    return bool(TEMPLATE_PATTERN.search(value))
+    return classify(value)[0] != 'plain'
 
 def is_function_ref(value: str) -> tuple[bool, str]:
     """Check if value is a function reference. Returns (is_fn, resolver_name)."""
-    if not value:
-        return False, ""
-    match = FUNCTION_PATTERN.match(value.strip())
-    if match:
-        return True, match.group(1)
+    kind, name = classify(value)
+    if kind == 'fn':
+        return True, name
     return False, ""
 
-async def resolve_value(value: str, context: Dict[str, Any], request: Any = None) -> Any:
-    """Resolve a single value - either function or template."""
-    is_fn, resolver_name = is_function_ref(value)
-    if is_fn:
-        # Function resolution via registry
-        return await ContextComputeRegistry.resolve(resolver_name, context, request)
-    elif has_template(value):
-        # Template resolution via runtime-template-resolver
+def _resolve_template(value: str, context: Dict[str, Any], template_cache: Optional[Dict[str, Any]]) -> Any:
+    # Template resolution via runtime-template-resolver
+    if template_cache is None:
         return resolve(value, context)
+    if value in template_cache:
+        return template_cache[value]
+    resolved = template_cache[value] = resolve(value, context)
+    return resolved
+
+async def resolve_value(
+    value: str,
+    context: Dict[str, Any],
+    request: Any = None,
+    template_cache: Optional[Dict[str, Any]] = None,
+    fn_cache: Optional[Dict[str, Any]] = None
+) -> Any:
+    """Resolve a single value - either function or template.
+
+    When template_cache / fn_cache are given, template results and function
+    results are memoized by template string / resolver name; the caller owns
+    the dicts and must not reuse them across contexts.
+    """
+    kind, resolver_name = classify(value)
+    if kind == 'fn':
+        # Function resolution via registry
+        if fn_cache is None:
+            return await ContextComputeRegistry.resolve(resolver_name, context, request)
+        if resolver_name in fn_cache:
+            return fn_cache[resolver_name]
+        resolved = fn_cache[resolver_name] = await ContextComputeRegistry.resolve(resolver_name, context, request)
+        return resolved
+    elif kind == 'tpl':
+        return _resolve_template(value, context, template_cache)
     return value
 
-async def resolve_deep(obj: Any, context: Dict[str, Any], request: Any = None, visited: Optional[Set[int]] = None) -> Any:
-    """Recursively resolve templates and functions in nested objects."""
+# A template or function-ref leaf: (container, key, kind, template or resolver name)
+Slot = Tuple[Any, Any, str, str]
+
+def _collect_slots(obj: Any, visited: Set[int]) -> Tuple[List[Any], List[Slot]]:
+    """Copy obj's containers into a one-item holder list and record its
+    template / function-ref leaves as slots, in document order.
+
+    Like the recursive walk this replaces, a container seen before (shared
+    or cyclic) is only resolved at its first occurrence.
+    """
+    holder = [obj]
+    slots: List[Slot] = []
+    stack = [(holder, 0, obj)]
+    while stack:
+        parent, key, value = stack.pop()
+        if isinstance(value, str):
+            kind, resolver_name = classify(value)
+            if kind == 'fn':
+                slots.append((parent, key, kind, resolver_name))
+            elif kind == 'tpl':
+                slots.append((parent, key, kind, value))
+        elif isinstance(value, dict):
+            value_id = id(value)
+            if value_id in visited:
+                continue
+            visited.add(value_id)
+            out = dict(value)
+            parent[key] = out
+            # Pushed in reverse so they pop in document order
+            for k, v in reversed(value.items()):
+                stack.append((out, k, v))
+        elif isinstance(value, list):
+            value_id = id(value)
+            if value_id in visited:
+                continue
+            visited.add(value_id)
+            out = list(value)
+            parent[key] = out
+            for i in range(len(value) - 1, -1, -1):
+                stack.append((out, i, value[i]))
+    return holder, slots
+
+async def _resolve_function(
+    resolver_name: str,
+    context: Dict[str, Any],
+    request: Any,
+    semaphore: asyncio.Semaphore
+) -> Any:
+    async with semaphore:
+        return await ContextComputeRegistry.resolve(resolver_name, context, request)
+
+async def _fill_slots(
+    slots: List[Slot],
+    context: Dict[str, Any],
+    request: Any,
+    template_cache: Optional[Dict[str, Any]],
+    fn_cache: Optional[Dict[str, Any]],
+    semaphore: Optional[asyncio.Semaphore]
+) -> None:
+    if semaphore is None:
+        # Sequential, in document order, exactly like the recursive walk did
+        for parent, key, kind, payload in slots:
+            if kind == 'tpl':
+                parent[key] = _resolve_template(payload, context, template_cache)
+            elif fn_cache is None:
+                parent[key] = await ContextComputeRegistry.resolve(payload, context, request)
+            elif payload in fn_cache:
+                parent[key] = fn_cache[payload]
+            else:
+                resolved = fn_cache[payload] = await ContextComputeRegistry.resolve(payload, context, request)
+                parent[key] = resolved
+        return
+
+    # Opt-in concurrency: templates inline, function calls gathered under the semaphore
+    fn_slots = []
+    for parent, key, kind, payload in slots:
+        if kind == 'tpl':
+            parent[key] = _resolve_template(payload, context, template_cache)
+        else:
+            fn_slots.append((parent, key, payload))
+    if not fn_slots:
+        return
+
+    if fn_cache is None:
+        values = await asyncio.gather(*(
+            _resolve_function(resolver_name, context, request, semaphore)
+            for _, _, resolver_name in fn_slots
+        ))
+    else:
+        # dict.fromkeys keeps first-occurrence order while dropping repeats
+        pending = [name for name in dict.fromkeys(name for _, _, name in fn_slots) if name not in fn_cache]
+        results = await asyncio.gather(*(
+            _resolve_function(resolver_name, context, request, semaphore)
+            for resolver_name in pending
+        ))
+        fn_cache.update(zip(pending, results))
+        values = [fn_cache[resolver_name] for _, _, resolver_name in fn_slots]
+    for (parent, key, _), value in zip(fn_slots, values):
+        parent[key] = value
+
+async def resolve_deep(
+    obj: Any,
+    context: Dict[str, Any],
+    request: Any = None,
+    visited: Optional[Set[int]] = None,
+    template_cache: Optional[Dict[str, Any]] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    fn_cache: Optional[Dict[str, Any]] = None
+) -> Any:
+    """Recursively resolve templates and functions in nested objects.
+
+    Leaves are resolved in document order and function resolvers are
+    awaited one after another. Passing a semaphore opts in to running the
+    function resolvers concurrently, at most as many at once as the
+    semaphore allows. When fn_cache is given, each resolver name is called
+    at most once.
+    """
     if visited is None:
         visited = set()
 
-    obj_id = id(obj)
-    if obj_id in visited:
-        return obj
+    holder, slots = _collect_slots(obj, visited)
+    if slots:
+        await _fill_slots(slots, context, request, template_cache, fn_cache, semaphore)
+    return holder[0]
+
+# Path into an overlay: the first key indexes a one-item holder list around
+# the overlay root, the rest are dict keys / list indexes below it
+OverlayPath = Tuple[Any, ...]
+
+# Compiled plans keyed by (id() of the overlay, config generation); the
+# overlay is kept alive alongside its plan so the id can't be reused
+_PLAN_CACHE: Dict[Tuple[int, Any], Tuple[Any, 'ContextOverlayPlan']] = {}
+_PLAN_CACHE_MAX = 256
+# Last config generation seen; plans from older generations are dropped
+_plan_cache_generation: Any = None
+
+def _slot_at(holder: List[Any], path: OverlayPath) -> Tuple[Any, Any]:
+    node = holder
+    for key in path[:-1]:
+        node = node[key]
+    return node, path[-1]
+
+@dataclass
+class ContextOverlayPlan:
+    """Precompiled overwrite_from_context overlay.
+
+    The overlay comes from static YAML, so its template and function-ref
+    leaves are located once, in document order; each request only fills
+    those slots.
+    """
+
+    skeleton: Any
+    # (path, kind, template or resolver name), kind being 'fn' or 'tpl'
+    entries: List[Tuple[OverlayPath, str, str]] = field(default_factory=list)
 
-    if isinstance(obj, str):
-        return await resolve_value(obj, context, request)
+    @property
+    def fn_entries(self) -> List[Tuple[OverlayPath, str]]:
+        return [(path, payload) for path, kind, payload in self.entries if kind == 'fn']
 
-    if isinstance(obj, dict):
-        visited.add(obj_id)
-        result = {}
-        for key, value in obj.items():
-            result[key] = await resolve_deep(value, context, request, visited)
-        return result
+    @property
+    def tpl_entries(self) -> List[Tuple[OverlayPath, str]]:
+        return [(path, payload) for path, kind, payload in self.entries if kind == 'tpl']
 
-    if isinstance(obj, list):
-        visited.add(obj_id)
-        # Process list sequentially to preserve order
-        items = []
-        for item in obj:
-            items.append(await resolve_deep(item, context, request, visited))
-        return items
+    @property
+    def is_static(self) -> bool:
+        return not self.entries
 
-    return obj  # Primitives
+    @classmethod
+    def compile(cls, meta: Any) -> 'ContextOverlayPlan':
+        plan = cls(skeleton=meta)
+        visited: Set[int] = set()
+        stack: List[Tuple[OverlayPath, Any]] = [((0,), meta)]
+        while stack:
+            path, value = stack.pop()
+            if isinstance(value, str):
+                kind, resolver_name = classify(value)
+                if kind == 'fn':
+                    plan.entries.append((path, kind, resolver_name))
+                elif kind == 'tpl':
+                    plan.entries.append((path, kind, value))
+            elif isinstance(value, (dict, list)):
+                # Same shared-node rule as resolve_deep: only the first occurrence is resolved
+                value_id = id(value)
+                if value_id in visited:
+                    continue
+                visited.add(value_id)
+                items = list(value.items() if isinstance(value, dict) else enumerate(value))
+                # Pushed in reverse so they pop in document order
+                for key, item in reversed(items):
+                    stack.append((path + (key,), item))
+        return plan
+
+    @classmethod
+    def for_meta(cls, meta: Any, generation: Any = None) -> 'ContextOverlayPlan':
+        """Return the cached plan for this overlay object, compiling it on first use.
+
+        generation is the config reload counter (AppYamlConfig.get_generation());
+        a new generation drops every plan compiled before it. Callers that
+        change an overlay in place must call clear_cache() themselves.
+        """
+        global _plan_cache_generation
+        if generation is not None and generation != _plan_cache_generation:
+            _PLAN_CACHE.clear()
+            _plan_cache_generation = generation
+
+        key = (id(meta), generation)
+        entry = _PLAN_CACHE.get(key)
+        if entry is not None and entry[0] is meta:
+            return entry[1]
+        plan = cls.compile(meta)
+        if len(_PLAN_CACHE) >= _PLAN_CACHE_MAX:
+            _PLAN_CACHE.clear()
+        _PLAN_CACHE[key] = (meta, plan)
+        return plan
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all compiled plans."""
+        _PLAN_CACHE.clear()
+
+    def materialize(self) -> List[Any]:
+        """Copy of the skeleton, in a holder list, that is safe to fill in.
+
+        Only the containers on the way to a template or function slot are
+        copied; everything else is shared with the skeleton.
+        """
+        holder = [self.skeleton]
+        copied: Set[int] = set()
+        for path, _, _ in self.entries:
+            node = holder
+            for key in path[:-1]:
+                child = node[key]
+                if id(child) not in copied:
+                    child = dict(child) if isinstance(child, dict) else list(child)
+                    node[key] = child
+                    copied.add(id(child))
+                node = child
+        return holder
+
+    def slots(self, holder: List[Any]) -> List[Slot]:
+        """Slots of a materialized holder, in document order."""
+        return [_slot_at(holder, path) + (kind, payload) for path, kind, payload in self.entries]
+
+def _copy_tree(obj: Any) -> Any:
+    """Copy the dicts and lists of obj so the result shares no container with it.
+
+    Cheaper than deepcopy for config trees: leaves are YAML scalars (or
+    resolver results) and are not copied. Shared and cyclic containers keep
+    their shape through a memo, as with deepcopy.
+    """
+    if not isinstance(obj, (dict, list)):
+        return obj
+    root = dict(obj) if isinstance(obj, dict) else list(obj)
+    memo = {id(obj): root}
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        items = list(node.items()) if isinstance(node, dict) else list(enumerate(node))
+        for key, value in items:
+            if isinstance(value, (dict, list)):
+                copied = memo.get(id(value))
+                if copied is None:
+                    copied = memo[id(value)] = dict(value) if isinstance(value, dict) else list(value)
+                    stack.append(copied)
+                node[key] = copied
+    return root
 
 def deep_merge(base: Dict, overlay: Dict) -> Dict:
-    """Deep merge overlay into base, overlay values take precedence."""
-    # Start with a deep copy of base to avoid mutation
-    result = deepcopy(base)
-    
-    for key, value in overlay.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
-            
+    """Deep merge overlay into base, overlay values take precedence.
+
+    The result is an independent tree: neither base nor overlay shares a
+    container with it, so callers may mutate it freely.
+    """
+    result = _copy_tree(base)
+
+    # Explicit work stack of (result dict, overlay dict) pairs instead of recursion
+    stack = [(result, overlay)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                target[key] = _copy_tree(value)
+
     return result
 
 class ContextResolver:
-    """Resolves templates and functions from overwrite_from_context meta key."""
+    """Resolves templates and functions from overwrite_from_context meta key.
+
+    Use the static apply() to pass context and request per call without
+    allocating a resolver per request; instances remain supported as a thin
+    wrapper around it.
+    """
 
-    def __init__(self, context: Dict[str, Any], request: Any = None):
+    # Compute functions run one at a time, in document order, unless a
+    # caller opts in to concurrency
+    DEFAULT_MAX_CONCURRENCY = 1
+
+    def __init__(self, context: Dict[str, Any], request: Any = None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
         self.context = context
         self.request = request
+        self.max_concurrency = max_concurrency
 
     async def apply_context_overwrite(self, config: Dict[str, Any], context_meta: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply overwrite_from_context to config using this resolver's context."""
+        return await ContextResolver.apply(
+            config, context_meta, self.context, self.request, self.max_concurrency
+        )
+
+    @staticmethod
+    async def apply(
+        config: Dict[str, Any],
+        context_meta: Dict[str, Any],
+        context: Dict[str, Any],
+        request: Any = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        generation: Any = None
+    ) -> Dict[str, Any]:
         """
         Apply overwrite_from_context to config.
 
         Args:
             config: The config dict (after overwrite_from_env applied)
             context_meta: The overwrite_from_context meta key value
+            context: Template context for this request
+            request: Request passed to request-time compute functions
+            max_concurrency: Compute functions run sequentially in document
+                order by default; above 1 they run concurrently, at most this
+                many at once, which suits only order-independent resolvers
+            generation: Config generation the overlay belongs to; compiled
+                overlay plans are discarded when it changes
 
         Returns:
             Config with templates/functions resolved and merged
@@ -96,8 +413,19 @@ class ContextResolver:
         if not context_meta:
             return config
 
-        # Resolve all templates and functions in the context_meta
-        resolved_overlay = await resolve_deep(context_meta, self.context, self.request)
+        plan = ContextOverlayPlan.for_meta(context_meta, generation)
+
+        # Purely static overlays need no resolution at all
+        if plan.is_static:
+            return deep_merge(config, context_meta)
+
+        holder = plan.materialize()
+
+        # Template and function results are shared within this call only,
+        # since the context may change between calls.
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency > 1 else None
+        await _fill_slots(plan.slots(holder), context, request, {}, {}, semaphore)
+        resolved_overlay = holder[0]
 
         # Deep merge resolved values into config
         return deep_merge(config, resolved_overlay)
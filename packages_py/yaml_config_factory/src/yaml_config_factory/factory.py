@@ -1,6 +1,8 @@
 
 import logging
+import sys
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from typing import Literal, Union, Dict, Any, Optional, Callable
 from app_yaml_config import (
     AppYamlConfig,
@@ -21,8 +23,47 @@ logger = logging.getLogger(__name__)
 
 ConfigPath = Literal['providers', 'services', 'storages']
 
+_VALID_CONFIG_TYPES = frozenset(map(sys.intern, ('providers', 'services', 'storages')))
+_META_KEYS = frozenset(('overwrite_from_env', 'fallbacks_from_env', 'overwrite_from_context'))
+# AuthConfig attribute -> encode_auth keyword, passed only when truthy
+_CRED_MAP = (
+    ('username', 'username'),
+    ('password', 'password'),
+    ('email', 'email'),
+    ('token', 'token'),
+    ('header_name', 'header_key'),
+    ('header_value', 'header_value'),
+)
+
+
+# Depends only on the path string, so results are shared across factories
+@lru_cache(maxsize=1024)
+def _parse_path(path: str) -> tuple[str, str]:
+    if not path:
+        raise ValueError("Path cannot be empty")
+
+    config_type, sep, config_name = path.partition('.')
+    if not sep or '.' in config_name:
+        raise ValueError(f"Invalid path format '{path}'. Expected 'type.name' (e.g. providers.anthropic)")
+
+    if config_type not in _VALID_CONFIG_TYPES:
+        raise ValueError(f"Invalid config type '{config_type}'. Must be providers, services, or storages.")
+
+    # Backward compatibility / Schema mapping
+    # Config has 'storage' root key, whilst path logic uses 'storages' plural convention
+    if config_type == 'storages':
+        config_type = 'storage'
+
+    # Interned so later dict-key comparisons on these names hit the identity check
+    return sys.intern(config_type), sys.intern(config_name)
 
-@dataclass
+
+def _strip_meta_keys(raw: Dict[str, Any]) -> Dict[str, Any]:
+    # Shallow copy without meta keys, in one pass
+    return {k: v for k, v in raw.items() if k not in _META_KEYS}
+
+
+@dataclass(slots=True)
 class NetworkConfig:
     default_environment: str = "dev"
     proxy_urls: Dict[str, Optional[str]] = field(default_factory=dict)
@@ -32,7 +73,7 @@ class NetworkConfig:
     agent_proxy: Optional[Dict[str, Optional[str]]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ComputeOptions:
     include_headers: bool = False
     include_proxy: bool = False
@@ -43,7 +84,7 @@ class ComputeOptions:
     resolve_templates: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ComputeResult:
     config_type: ConfigPath
     config_name: str
@@ -55,6 +96,60 @@ class ComputeResult:
     config: Optional[Dict[str, Any]] = None
 
 
+class LazyComputeResult:
+    """ComputeResult view whose proxy and network aspects are computed on first access.
+
+    Auth, headers and config are resolved eagerly (they may need to await
+    context functions); proxy_config and network_config call back into the
+    factory only when read, so any resolution error surfaces at that point.
+    """
+
+    def __init__(self, result: ComputeResult, factory: 'YamlConfigFactory', path: str, environment: Optional[str] = None):
+        self._result = result
+        self._factory = factory
+        self._path = path
+        self._environment = environment
+
+    @property
+    def config_type(self) -> ConfigPath:
+        return self._result.config_type
+
+    @property
+    def config_name(self) -> str:
+        return self._result.config_name
+
+    @property
+    def auth_config(self) -> Optional[AuthConfig]:
+        return self._result.auth_config
+
+    @property
+    def auth_error(self) -> Optional[Exception]:
+        return self._result.auth_error
+
+    @property
+    def headers(self) -> Optional[Dict[str, str]]:
+        return self._result.headers
+
+    @property
+    def config(self) -> Optional[Dict[str, Any]]:
+        return self._result.config
+
+    @cached_property
+    def proxy_config(self) -> ProxyResolutionResult:
+        return self._factory.compute_proxy(self._path, self._environment)
+
+    @cached_property
+    def network_config(self) -> NetworkConfig:
+        return self._factory.compute_network()
+
+    def to_result(self) -> ComputeResult:
+        """Materialize every aspect into a plain ComputeResult."""
+        result = self._result
+        result.proxy_config = self.proxy_config
+        result.network_config = self.network_config
+        return result
+
+
 class YamlConfigFactory:
     """Factory for computing fully resolved runtime configuration."""
 
@@ -68,6 +163,31 @@ class YamlConfigFactory:
         self._fetch_auth_config_fn = fetch_auth_config_fn
         self._encode_auth_fn = encode_auth_fn
         self._startup_context = ContextBuilder.build_startup_context(config)
+        # Built from the 'global' section on first use; see refresh()
+        self._global_config: Optional[Dict[str, Any]] = None
+        self._network_config: Optional[NetworkConfig] = None
+        self._generation: Any = None
+
+    def refresh(self) -> None:
+        """Drop cached global/network config, e.g. after the underlying config reloads."""
+        self._global_config = None
+        self._network_config = None
+
+    def _config_generation(self) -> Any:
+        """Current config generation; cached state is refreshed when it changes."""
+        get_generation = getattr(self._config, 'get_generation', None)
+        generation = get_generation() if get_generation is not None else None
+        if generation != self._generation:
+            self._generation = generation
+            self.refresh()
+        return generation
+
+    def _get_global_config(self) -> Dict[str, Any]:
+        self._config_generation()
+        global_config = self._global_config
+        if global_config is None:
+            global_config = self._global_config = self._config.get('global') or {}
+        return global_config
 
     async def compute(
         self,
@@ -85,23 +205,28 @@ class YamlConfigFactory:
             config_type, config_name = self._parse_path(path)
 
             # Build full context for template/function resolution
-            context_resolver = None
+            full_context = None
             if opts.resolve_templates:
                 request_ctx = ContextBuilder.build_request_context(request)
                 full_context = ContextBuilder.merge_contexts(self._startup_context, request_ctx)
-                context_resolver = ContextResolver(full_context, request)
 
             # 1. Auth Resolution
             auth_result = {}
             auth_error = None
+            # Fetched once and shared by the aspects below. The lookup sits in the
+            # suppressed region so a missing config still surfaces as auth_error;
+            # if it failed, later aspects fetch (and raise) on their own.
+            raw_config = None
             
             try:
+                raw_config = self._get_raw_config(config_type, config_name, remove_meta_keys=False)
                 auth_result = await self._compute_auth_internal(
                     config_type, 
                     config_name, 
                     opts.include_headers, 
                     request,
-                    context_resolver
+                    full_context,
+                    raw=raw_config
                 )
             except Exception as e:
                 if opts.suppress_auth_errors:
@@ -121,7 +246,7 @@ class YamlConfigFactory:
             # 2. Proxy Resolution
             if opts.include_proxy:
                 logger.debug("compute: Resolving proxy")
-                result.proxy_config = self.compute_proxy(path, opts.environment)
+                result.proxy_config = self.compute_proxy(path, opts.environment, raw=raw_config)
 
             # 3. Network Configuration
             if opts.include_network:
@@ -131,7 +256,7 @@ class YamlConfigFactory:
             # 4. Raw Config
             if opts.include_config:
                 logger.debug("compute: Retrieving raw config")
-                result.config = await self.compute_config(path, context_resolver)
+                result.config = await self.compute_config(path, full_context, raw=raw_config, request=request)
 
             logger.debug(f"compute: Completed type={config_type} name={config_name}")
             return result
@@ -140,15 +265,23 @@ class YamlConfigFactory:
             logger.error(f"compute failed path={path} error={str(e)}", exc_info=True)
             raise e
 
-    def compute_proxy(self, path: str, environment: Optional[str] = None) -> ProxyResolutionResult:
-        """Compute proxy configuration."""
+    def compute_proxy(
+        self,
+        path: str,
+        environment: Optional[str] = None,
+        raw: Optional[Dict[str, Any]] = None
+    ) -> ProxyResolutionResult:
+        """Compute proxy configuration.
+
+        raw, when given, is the already fetched config (meta keys intact).
+        """
         logger.debug(f"compute_proxy: Starting path={path} env={environment}")
         
         config_type, config_name = self._parse_path(path)
         
         # Get raw config with meta keys intact
-        raw_config = self._get_raw_config(config_type, config_name, remove_meta_keys=False)
-        global_config = self._config.get('global') or {}
+        raw_config = raw if raw is not None else self._get_raw_config(config_type, config_name, remove_meta_keys=False)
+        global_config = self._get_global_config()
         
         load_result = self._config.get_load_result()
         app_env = environment or (load_result.app_env if load_result else 'dev')
@@ -159,10 +292,19 @@ class YamlConfigFactory:
         return result
 
     def compute_network(self) -> NetworkConfig:
-        """Compute network configuration."""
+        """Compute network configuration.
+
+        The result is built once per factory and shared between calls;
+        treat it as read-only.
+        """
         logger.debug("compute_network: Starting")
-        
-        global_config = self._config.get('global') or {}
+
+        self._config_generation()
+        if self._network_config is not None:
+            logger.debug("compute_network: Completed (cached)")
+            return self._network_config
+
+        global_config = self._get_global_config()
         network = global_config.get('network') or {}
         
         agent_proxy_dict = None
@@ -180,12 +322,23 @@ class YamlConfigFactory:
             cert_verify=network.get('cert_verify', False),
             agent_proxy=agent_proxy_dict
         )
+        self._network_config = result
         
         logger.debug("compute_network: Completed")
         return result
 
-    async def compute_config(self, path: str, context_resolver: Optional[ContextResolver] = None) -> Dict[str, Any]:
-        """Get fully resolved configuration with env vars applied."""
+    async def compute_config(
+        self,
+        path: str,
+        context: Optional[Dict[str, Any]] = None,
+        raw: Optional[Dict[str, Any]] = None,
+        request: Any = None
+    ) -> Dict[str, Any]:
+        """Get fully resolved configuration with env vars applied.
+
+        overwrite_from_context is applied when a template context is given.
+        raw, when given, is the already fetched config (meta keys intact).
+        """
         logger.debug(f"compute_config: Starting path={path}")
         config_type, config_name = self._parse_path(path)
 
@@ -202,22 +355,23 @@ class YamlConfigFactory:
             config = result.config
         else:
             # Fallback to raw config
-            config = self._get_raw_config(config_type, config_name, remove_meta_keys=True)
+            if raw is None:
+                raw = self._get_raw_config(config_type, config_name, remove_meta_keys=False)
+            config = _strip_meta_keys(raw)
 
         # Step 2: Apply overwrite_from_context (NEW - async for function resolution)
-        if context_resolver:
-            raw_config = self._get_raw_config(config_type, config_name, remove_meta_keys=False)
-            context_meta = raw_config.get('overwrite_from_context', {})
+        if context is not None:
+            if raw is None:
+                raw = self._get_raw_config(config_type, config_name, remove_meta_keys=False)
+            context_meta = raw.get('overwrite_from_context', {})
             if context_meta:
-                config = await context_resolver.apply_context_overwrite(config, context_meta)
+                config = await ContextResolver.apply(
+                    config, context_meta, context, request, generation=self._config_generation()
+                )
 
             # Cleanup meta key from result
             if isinstance(config, dict) and 'overwrite_from_context' in config:
-                # We need to copy if we want to avoid mutating cached config? 
-                # config came from get_provider which returns deep merged copy usually?
-                # But safer to pop.
-                # However, if config is reused, mutating it is bad.
-                # deep_merge returns a deepcopy. So config is a new object. safe to mutate.
+                # deep_merge returns an independent copy, so popping is safe.
                 config.pop('overwrite_from_context', None)
 
 
@@ -228,40 +382,25 @@ class YamlConfigFactory:
         path: str,
         environment: Optional[str] = None,
         request: Any = None
-    ) -> ComputeResult:
-        """Convenience method to get all configuration aspects."""
-        return await self.compute(path, ComputeOptions(
+    ) -> LazyComputeResult:
+        """Convenience method to get all configuration aspects.
+
+        Proxy and network configuration are deferred until first accessed.
+        """
+        result = await self.compute(path, ComputeOptions(
             include_headers=True,
-            include_proxy=True,
-            include_network=True,
             include_config=True,
             suppress_auth_errors=True,
             environment=environment
         ), request)
+        return LazyComputeResult(result, self, path, environment)
 
     # =========================================================================
     # Internal Helpers
     # =========================================================================
 
     def _parse_path(self, path: str) -> tuple[str, str]:
-        if not path:
-            raise ValueError("Path cannot be empty")
-
-        parts = path.split('.')
-        if len(parts) != 2:
-            raise ValueError(f"Invalid path format '{path}'. Expected 'type.name' (e.g. providers.anthropic)")
-
-        config_type, config_name = parts[0], parts[1]
-
-        if config_type not in ['providers', 'services', 'storages']:
-            raise ValueError(f"Invalid config type '{config_type}'. Must be providers, services, or storages.")
-        
-        # Backward compatibility / Schema mapping
-        # Config has 'storage' root key, whilst path logic uses 'storages' plural convention
-        if config_type == 'storages':
-            config_type = 'storage'
-
-        return config_type, config_name
+        return _parse_path(path)
 
     def _get_raw_config(self, config_type: str, config_name: str, remove_meta_keys: bool) -> Dict[str, Any]:
         # Access raw config using public API logic
@@ -271,12 +410,7 @@ class YamlConfigFactory:
             raise ValueError(f"Configuration not found for '{config_type}.{config_name}'")
 
         if remove_meta_keys:
-            # Shallow copy to remove meta keys safely
-            clean = raw.copy()
-            clean.pop('overwrite_from_env', None)
-            clean.pop('fallbacks_from_env', None)
-            clean.pop('overwrite_from_context', None)
-            return clean
+            return _strip_meta_keys(raw)
 
         return raw
 
@@ -286,30 +420,27 @@ class YamlConfigFactory:
         config_name: str,
         include_headers: bool = False,
         request: Any = None,
-        context_resolver: Optional[ContextResolver] = None
+        context: Optional[Dict[str, Any]] = None,
+        raw: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         logger.debug(f"compute_auth_internal type={config_type} name={config_name}")
         
-        raw_config = self._get_raw_config(config_type, config_name, remove_meta_keys=False)
+        raw_config = raw if raw is not None else self._get_raw_config(config_type, config_name, remove_meta_keys=False)
         
         # Apply overwrite_from_context before calculating auth
-        if context_resolver:
+        if context is not None:
             context_meta = raw_config.get('overwrite_from_context', {})
             if context_meta:
-                raw_config = await context_resolver.apply_context_overwrite(raw_config, context_meta)
+                raw_config = await ContextResolver.apply(
+                    raw_config, context_meta, context, request, generation=self._config_generation()
+                )
 
         auth_config = await self._fetch_auth_config_fn(config_name, raw_config, request)
         
         result = {"auth_config": auth_config}
 
         if include_headers:
-            creds = {}
-            if auth_config.username: creds['username'] = auth_config.username
-            if auth_config.password: creds['password'] = auth_config.password
-            if auth_config.email: creds['email'] = auth_config.email
-            if auth_config.token: creds['token'] = auth_config.token
-            if auth_config.header_name: creds['header_key'] = auth_config.header_name
-            if auth_config.header_value: creds['header_value'] = auth_config.header_value
+            creds = {key: value for attr, key in _CRED_MAP if (value := getattr(auth_config, attr))}
 
             headers = self._encode_auth_fn(
                 auth_config.type.value if hasattr(auth_config.type, 'value') else str(auth_config.type), 
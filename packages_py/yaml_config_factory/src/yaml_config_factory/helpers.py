@@ -1,7 +1,8 @@
-from typing import Dict, Any
-from .factory import ComputeResult
+from enum import Enum
+from typing import Dict, Any, Union
+from .factory import ComputeResult, LazyComputeResult
 
-def create_runtime_config_response(result: ComputeResult) -> Dict[str, Any]:
+def create_runtime_config_response(result: Union[ComputeResult, LazyComputeResult]) -> Dict[str, Any]:
     """
     Format a ComputeResult into a standardized runtime config response.
     """
@@ -14,31 +15,12 @@ def create_runtime_config_response(result: ComputeResult) -> Dict[str, Any]:
     }
 
     if result.auth_config:
+        auth_type = result.auth_config.type
+        type_str = auth_type.value if isinstance(auth_type, Enum) else str(auth_type)
+        # AuthConfig doesn't track resolution info (resolved_from / is_placeholder)
+        # yet, so only the type is returned for now.
         response["auth_config"] = {
-            "type": result.auth_config.type.value if hasattr(result.auth_config.type, 'value') else str(result.auth_config.type),
-            "resolution": {
-               "resolved_from": "config", # Default, ideally we track this better but for now hardcode/guess or leave simple
-               # Actually fetch_auth_config doesn't return source info yet easily. 
-               # Let's just return key info masked.
-            }
-        }
-        # Simplify auth response for now to match requirement:
-        # "auth_config": {
-        #     "type": "basic|api_key|none",
-        #     "resolution": { ... }
-        # }
-        # We might need to enhance AuthConfig to have resolution info if we really want it.
-        # For now let's construct what we can.
-        
-        response["auth_config"] = {
-            "type": result.auth_config.type.value if hasattr(result.auth_config.type, 'value') else str(result.auth_config.type),
-            # Add other safe fields if needed, but requirements said "resolution".
-            # If we don't have resolution info in AuthConfig, we can omit or add placeholders.
-            # Looking at PLAN requirement: 
-            # "resolution": { "resolved_from": "env|config", "is_placeholder": false }
-            # We don't have this in ComputeResult.auth_config yet. 
-            # Let's skip resolution detail implementation for now or infer if possible. 
-            # Actually, let's just return the type and minimal info.
+            "type": type_str,
         }
     
     if result.proxy_config:
@@ -0,0 +1,47 @@
+import inspect
+import pytest
+from unittest.mock import patch
+from yaml_config_factory import ContextComputeRegistry
+
+
+@pytest.fixture
+def registry():
+    """Register resolvers for one test and restore the registry afterwards."""
+    saved_resolvers = dict(ContextComputeRegistry._request_resolvers)
+    saved_accepts = dict(ContextComputeRegistry._accepts_request)
+    yield ContextComputeRegistry
+    ContextComputeRegistry._request_resolvers.clear()
+    ContextComputeRegistry._request_resolvers.update(saved_resolvers)
+    ContextComputeRegistry._accepts_request.clear()
+    ContextComputeRegistry._accepts_request.update(saved_accepts)
+
+
+class TestContextComputeRegistry:
+    """Tests for request resolver dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_request_is_passed_only_to_resolvers_that_take_it(self, registry):
+        @registry.register_request("with_request")
+        def with_request(context, request=None):
+            return request
+
+        @registry.register_request("without_request")
+        async def without_request(context):
+            return context["value"]
+
+        assert await registry.resolve("with_request", {}, request="req") == "req"
+        assert await registry.resolve("without_request", {"value": 1}, request="req") == 1
+
+    @pytest.mark.asyncio
+    async def test_signature_is_inspected_once_for_undecorated_resolvers(self, registry):
+        def resolver(context, request=None):
+            return request
+
+        registry._request_resolvers["plain"] = resolver
+
+        with patch("yaml_config_factory.compute_registry.inspect.signature", wraps=inspect.signature) as signature:
+            assert await registry.resolve("plain", {}, request="a") == "a"
+            assert await registry.resolve("plain", {}, request="b") == "b"
+
+        assert signature.call_count == 1
+        assert registry._accepts_request[resolver] is True
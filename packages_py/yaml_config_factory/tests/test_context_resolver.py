@@ -0,0 +1,159 @@
+import asyncio
+import pytest
+from yaml_config_factory import ContextResolver, ContextComputeRegistry, ContextOverlayPlan, resolve_deep
+
+
+@pytest.fixture
+def registry():
+    """Register resolvers for one test and restore the registry afterwards."""
+    saved = dict(ContextComputeRegistry._request_resolvers)
+    yield ContextComputeRegistry
+    ContextComputeRegistry._request_resolvers.clear()
+    ContextComputeRegistry._request_resolvers.update(saved)
+
+
+class TestContextResolver:
+    """Tests for overwrite_from_context resolution."""
+
+    @pytest.mark.asyncio
+    async def test_instance_api_matches_static_apply(self):
+        context = {"request": {"headers": {"x-tenant": "acme"}}}
+        config = {"base_url": "http://original", "headers": {"X-Static": "1"}}
+        meta = {"headers": {"X-Tenant": "{{request.headers.x-tenant}}"}}
+
+        via_instance = await ContextResolver(context).apply_context_overwrite(config, meta)
+        via_static = await ContextResolver.apply(config, meta, context)
+
+        assert via_instance == via_static == {
+            "base_url": "http://original",
+            "headers": {"X-Static": "1", "X-Tenant": "acme"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_functions_run_sequentially_in_document_order(self, registry):
+        calls = []
+        active = 0
+        max_active = 0
+
+        def make(name):
+            async def resolver(context):
+                nonlocal active, max_active
+                active += 1
+                max_active = max(max_active, active)
+                calls.append(name)
+                await asyncio.sleep(0)
+                active -= 1
+                return name.upper()
+            return resolver
+
+        for name in ("first", "second", "third"):
+            registry.register_request(name)(make(name))
+
+        meta = {
+            "a": "{{fn:first}}",
+            "b": {"c": ["{{fn:second}}", "{{fn:first}}"]},
+            "d": "{{fn:third}}",
+        }
+        result = await ContextResolver.apply({}, meta, {})
+
+        assert calls == ["first", "second", "third"]
+        assert max_active == 1
+        assert result == {"a": "FIRST", "b": {"c": ["SECOND", "FIRST"]}, "d": "THIRD"}
+
+    @pytest.mark.asyncio
+    async def test_opt_in_concurrency_is_bounded(self, registry):
+        active = 0
+        max_active = 0
+
+        def make(name):
+            async def resolver(context):
+                nonlocal active, max_active
+                active += 1
+                max_active = max(max_active, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+                return name
+            return resolver
+
+        names = [f"fn{i}" for i in range(6)]
+        for name in names:
+            registry.register_request(name)(make(name))
+
+        meta = {name: "{{fn:%s}}" % name for name in names}
+        result = await ContextResolver.apply({}, meta, {}, max_concurrency=2)
+
+        assert result == {name: name for name in names}
+        assert max_active == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_node_resolves_at_first_occurrence(self):
+        shared = {"v": "{{value}}"}
+        obj = {"first": shared, "second": shared}
+
+        result = await resolve_deep(obj, {"value": "resolved"})
+
+        assert result["first"] == {"v": "resolved"}
+        # Later occurrences of an already visited node are left as-is
+        assert result["second"] is shared
+
+    @pytest.mark.asyncio
+    async def test_resolve_deep_does_not_mutate_input(self):
+        obj = {"a": ["{{value}}", {"b": "{{value}}"}], "c": 1}
+
+        result = await resolve_deep(obj, {"value": "x"})
+
+        assert result == {"a": ["x", {"b": "x"}], "c": 1}
+        assert obj == {"a": ["{{value}}", {"b": "{{value}}"}], "c": 1}
+
+    @pytest.mark.asyncio
+    async def test_merged_result_shares_nothing_with_inputs(self):
+        config = {"headers": {"X-Static": "1"}, "retry": {"codes": [500, 502]}}
+        meta = {"headers": {"X-Tenant": "{{tenant}}"}, "extra": {"tags": ["a"]}}
+        static_meta = {"extra": {"tags": ["a"]}}
+
+        for overlay in (meta, static_meta):
+            result = await ContextResolver.apply(config, overlay, {"tenant": "acme"})
+            result["headers"]["X-Static"] = "changed"
+            result["retry"]["codes"].append(503)
+            result["extra"]["tags"].append("b")
+
+        assert config == {"headers": {"X-Static": "1"}, "retry": {"codes": [500, 502]}}
+        assert meta == {"headers": {"X-Tenant": "{{tenant}}"}, "extra": {"tags": ["a"]}}
+        assert static_meta == {"extra": {"tags": ["a"]}}
+
+
+class TestContextOverlayPlanCache:
+    """Tests for the compiled overlay plan cache."""
+
+    @pytest.fixture(autouse=True)
+    def clean_cache(self):
+        ContextOverlayPlan.clear_cache()
+        yield
+        ContextOverlayPlan.clear_cache()
+
+    def test_plan_is_reused_within_a_generation(self):
+        meta = {"headers": {"X-Tenant": "{{tenant}}"}}
+
+        assert ContextOverlayPlan.for_meta(meta, 1) is ContextOverlayPlan.for_meta(meta, 1)
+
+    def test_new_generation_recompiles(self):
+        meta = {"headers": {"X-Tenant": "{{tenant}}"}}
+        first = ContextOverlayPlan.for_meta(meta, 1)
+
+        meta["headers"]["X-User"] = "{{user}}"
+        second = ContextOverlayPlan.for_meta(meta, 2)
+
+        assert second is not first
+        assert len(second.tpl_entries) == 2
+
+    @pytest.mark.asyncio
+    async def test_clear_cache_picks_up_in_place_changes(self):
+        meta = {"headers": {"X-Tenant": "{{tenant}}"}}
+        context = {"tenant": "acme", "user": "bob"}
+        await ContextResolver.apply({}, meta, context)
+
+        meta["headers"]["X-User"] = "{{user}}"
+        ContextOverlayPlan.clear_cache()
+        result = await ContextResolver.apply({}, meta, context)
+
+        assert result == {"headers": {"X-Tenant": "acme", "X-User": "bob"}}
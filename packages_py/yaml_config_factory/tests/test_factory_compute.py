@@ -0,0 +1,116 @@
+import pytest
+from unittest.mock import MagicMock, AsyncMock, call
+from yaml_config_factory import YamlConfigFactory, ComputeOptions
+
+
+class TestYamlConfigFactoryCompute:
+    """Async behaviour tests for YamlConfigFactory.compute."""
+
+    @pytest.fixture
+    def mock_app_config(self):
+        config = MagicMock()
+        config.get_load_result.return_value.app_env = 'dev'
+        config.get_all.return_value = {}
+        config.get.return_value = {}
+        return config
+
+    @pytest.fixture
+    def mock_fetch_auth(self):
+        mock = AsyncMock()
+        dummy_auth = MagicMock()
+        dummy_auth.type = 'none'
+        mock.return_value = dummy_auth
+        return mock
+
+    @pytest.fixture
+    def factory(self, mock_app_config, mock_fetch_auth):
+        return YamlConfigFactory(mock_app_config, mock_fetch_auth, MagicMock())
+
+    @pytest.mark.asyncio
+    async def test_missing_config_is_reported_as_suppressed_auth_error(self, factory, mock_app_config):
+        mock_app_config.get_nested.return_value = None
+
+        result = await factory.compute(
+            "providers.missing",
+            ComputeOptions(include_headers=True, suppress_auth_errors=True)
+        )
+
+        assert isinstance(result.auth_error, ValueError)
+        assert "Configuration not found" in str(result.auth_error)
+        assert result.auth_config is None
+
+    @pytest.mark.asyncio
+    async def test_missing_config_raises_without_suppression(self, factory, mock_app_config):
+        mock_app_config.get_nested.return_value = None
+
+        with pytest.raises(ValueError, match="Configuration not found"):
+            await factory.compute("providers.missing")
+
+    @pytest.mark.asyncio
+    async def test_missing_config_still_raises_for_other_aspects(self, factory, mock_app_config):
+        mock_app_config.get_nested.return_value = None
+
+        with pytest.raises(ValueError, match="Configuration not found"):
+            await factory.compute(
+                "providers.missing",
+                ComputeOptions(include_proxy=True, suppress_auth_errors=True)
+            )
+
+    @pytest.mark.asyncio
+    async def test_raw_config_is_fetched_once_per_compute(self, factory, mock_app_config):
+        mock_app_config.get_nested.return_value = {"base_url": "http://x"}
+
+        await factory.compute(
+            "services.test",
+            ComputeOptions(include_headers=True, include_proxy=True)
+        )
+
+        assert mock_app_config.get_nested.call_count == 1
+
+    def test_config_reload_drops_cached_global_and_network_config(self, factory, mock_app_config):
+        mock_app_config.get_generation.return_value = 1
+        mock_app_config.get.return_value = {"network": {"default_environment": "dev"}}
+        first = factory.compute_network()
+        assert factory.compute_network() is first
+
+        mock_app_config.get_generation.return_value = 2
+        mock_app_config.get.return_value = {"network": {"default_environment": "prod"}}
+
+        assert factory.compute_network().default_environment == "prod"
+
+    @pytest.mark.asyncio
+    async def test_compute_all_defers_proxy_and_network(self, factory, mock_app_config, monkeypatch):
+        mock_app_config.get_nested.return_value = {"base_url": "http://x"}
+        monkeypatch.setattr(
+            "yaml_config_factory.factory.get_service",
+            MagicMock(return_value=MagicMock(config={"base_url": "http://x"}))
+        )
+        factory.compute_proxy = MagicMock(return_value="proxy")
+        factory.compute_network = MagicMock(return_value="network")
+
+        result = await factory.compute_all("services.test", environment="prod")
+
+        factory.compute_proxy.assert_not_called()
+        factory.compute_network.assert_not_called()
+        assert result.config == {"base_url": "http://x"}
+        assert result.proxy_config == "proxy"
+        assert result.proxy_config == "proxy"
+        factory.compute_proxy.assert_called_once_with("services.test", "prod")
+
+        plain = result.to_result()
+        assert plain.network_config == "network"
+        assert plain.config == result.config
+        factory.compute_network.assert_called_once_with()
+
+    def test_global_config_is_read_once_until_refresh(self, factory, mock_app_config):
+        mock_app_config.get.return_value = {"network": {"default_environment": "dev"}}
+        first = factory.compute_network()
+
+        assert factory.compute_network() is first
+        assert mock_app_config.get.call_args_list.count(call('global')) == 1
+
+        mock_app_config.get.return_value = {"network": {"default_environment": "prod"}}
+        factory.refresh()
+
+        assert factory.compute_network().default_environment == "prod"
+        assert mock_app_config.get.call_args_list.count(call('global')) == 2
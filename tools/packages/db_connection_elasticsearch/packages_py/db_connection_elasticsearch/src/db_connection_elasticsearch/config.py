@@ -18,6 +18,19 @@ from .constants import (
 
 logger = logging.getLogger(__name__)
 
+_ENV_PREFIX = "ELASTIC_DB_"
+
+
+def _snapshot_env() -> Dict[str, str]:
+    """ELASTIC_DB_* variables keyed by lowercased suffix (ELASTIC_DB_HOST -> "host")."""
+    prefix_len = len(_ENV_PREFIX)
+    return {
+        key[prefix_len:].lower(): value
+        for key, value in os.environ.items()
+        # Only the upper-case spelling was ever looked up
+        if key.startswith(_ENV_PREFIX) and key.isupper()
+    }
+
 class ElasticsearchConfigError(ValueError):
     """Invalid configuration values."""
     pass
@@ -109,7 +122,9 @@ class ElasticsearchConfig:
 
     def _resolve_configuration(self, config_dict: Optional[Dict[str, Any]]) -> None:
         """Resolve configuration from multiple sources."""
-        
+        # One pass over os.environ per construction instead of a getenv per field
+        env = _snapshot_env()
+
         # Helper to get value from sources
         def get_val(field_name: str, arg_val: Any, default: Any, target_type: type = str) -> Any:
             # 1. Argument
@@ -117,8 +132,7 @@ class ElasticsearchConfig:
                 return arg_val
             
             # 2. Env Var
-            env_key = f"ELASTIC_DB_{field_name.upper()}"
-            env_val = os.getenv(env_key)
+            env_val = env.get(field_name)
             if env_val is not None:
                 if target_type == bool:
                     return env_val.lower() in ('true', '1', 'yes')
@@ -151,7 +165,7 @@ class ElasticsearchConfig:
         # Password can come from ELASTIC_DB_PASSWORD or ELASTIC_DB_ACCESS_KEY (DigitalOcean uses ACCESS_KEY)
         self.password = get_val("password", self.password, None)
         if self.password is None:
-            self.password = os.getenv("ELASTIC_DB_ACCESS_KEY")
+            self.password = env.get("access_key")
         self.api_auth_type = get_val("api_auth_type", self.api_auth_type, None)
         self.use_tls = get_val("use_tls", self.use_tls, False, bool)
         self.verify_certs = get_val("verify_certs", self.verify_certs, False, bool)
@@ -24,3 +24,17 @@ def test_env_or_defaults():
     else:
         assert config.vendor_type == "on-prem"
 
+
+def test_env_is_read_per_construction(monkeypatch):
+    first = ElasticsearchConfig(vendor_type="on-prem")
+
+    monkeypatch.setenv("ELASTIC_DB_HOST", "es.internal")
+    monkeypatch.setenv("ELASTIC_DB_PORT", "9300")
+    monkeypatch.setenv("ELASTIC_DB_ACCESS_KEY", "secret")
+    config = ElasticsearchConfig(vendor_type="on-prem")
+
+    assert (config.host, config.port, config.password) == ("es.internal", 9300, "secret")
+    assert first.host != "es.internal"
+
+    config.host = "changed"
+    assert ElasticsearchConfig(vendor_type="on-prem").host == "es.internal"